@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import logging
 import time
+from dataclasses import dataclass
 from typing import Any
 
+from houndmind_ai.core.config import SettingsCache
 from houndmind_ai.core.module import Module
 
 
@@ -18,6 +20,28 @@ def _safe_float(val: Any, default: float) -> float:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _AttentionParams:
+    cooldown_s: float
+    respect_scanning: bool
+    scan_block_s: float
+    head_yaw_max_deg: float
+    head_turn_speed: int
+    led_priority: int
+
+    @staticmethod
+    def from_settings(settings: dict) -> _AttentionParams:
+        attention = settings.get("attention", {})
+        return _AttentionParams(
+            cooldown_s=_safe_float(attention.get("sound_cooldown_s", 0.5), 0.5),
+            respect_scanning=bool(attention.get("respect_scanning", True)),
+            scan_block_s=_safe_float(attention.get("scan_block_s", 0.4), 0.4),
+            head_yaw_max_deg=_safe_float(attention.get("head_yaw_max_deg", 60.0), 60.0),
+            head_turn_speed=int(_safe_float(attention.get("head_turn_speed", 70), 70)),
+            led_priority=int(_safe_float(attention.get("led_priority", 60), 60)),
+        )
+
+
 class AttentionModule(Module):
     """Turn head toward detected sound direction.
 
@@ -27,9 +51,11 @@ class AttentionModule(Module):
     def __init__(self, name: str, enabled: bool = True, required: bool = False) -> None:
         super().__init__(name, enabled=enabled, required=required)
         self._last_attention_ts = 0.0
+        self._params = SettingsCache(_AttentionParams.from_settings)
 
     def tick(self, context) -> None:
-        settings = (context.get("settings") or {}).get("attention", {})
+        all_settings = context.get("settings") or {}
+        settings = all_settings.get("attention", {})
         if not settings.get("enabled", True):
             return
 
@@ -41,9 +67,9 @@ class AttentionModule(Module):
         if context.get("habituation:sound:habituated"):
             return
 
+        params = self._params.get(all_settings)
         now = time.time()
-        cooldown = _safe_float(settings.get("sound_cooldown_s", 0.5), 0.5)
-        if now - self._last_attention_ts < cooldown:
+        if now - self._last_attention_ts < params.cooldown_s:
             return
 
         sound_direction = perception.get("sound_direction")
@@ -51,24 +77,21 @@ class AttentionModule(Module):
             return
 
         # Optionally avoid head moves while scanning.
-        if settings.get("respect_scanning", True):
+        if params.respect_scanning:
             scan_reading = context.get("scan_reading")
             scan_ts = (
                 _safe_float(getattr(scan_reading, "timestamp", 0.0), 0.0) if scan_reading else 0.0
             )
-            block_s = _safe_float(settings.get("scan_block_s", 0.4), 0.4)
-            if now - scan_ts < block_s:
+            if now - scan_ts < params.scan_block_s:
                 return
 
-        yaw = _direction_to_yaw(
-            sound_direction, _safe_float(settings.get("head_yaw_max_deg", 60.0), 60.0)
-        )
+        yaw = _direction_to_yaw(sound_direction, params.head_yaw_max_deg)
         dog = context.get("pidog")
         if dog is None:
             return
 
         try:
-            dog.head_move([[yaw, 0, 0]], speed=int(settings.get("head_turn_speed", 70)))
+            dog.head_move([[yaw, 0, 0]], speed=params.head_turn_speed)
             if hasattr(dog, "wait_head_done"):
                 dog.wait_head_done()
         except Exception as exc:  # noqa: BLE001
@@ -82,7 +105,7 @@ class AttentionModule(Module):
             {
                 "timestamp": now,
                 "mode": "listen",
-                "priority": int(settings.get("led_priority", 60)),
+                "priority": params.led_priority,
             },
         )
 
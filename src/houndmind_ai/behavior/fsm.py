@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import random
 import time
+from collections.abc import Callable
 from enum import Enum
 
 from houndmind_ai.core.module import Module
@@ -11,6 +12,10 @@ from houndmind_ai.behavior.registry import BehaviorRegistry
 
 logger = logging.getLogger(__name__)
 
+# Bound methods of the shared module RNG; random.seed() still applies.
+_random = random.random
+_choice = random.choice
+
 
 class BehaviorState(str, Enum):
     IDLE = "idle"
@@ -23,6 +28,16 @@ class BehaviorState(str, Enum):
     REST = "rest"
 
 
+# Autonomy mode -> behavior state. Unknown modes fall back to IDLE.
+_AUTONOMY_STATES: dict[str, BehaviorState] = {
+    "patrol": BehaviorState.PATROL,
+    "explore": BehaviorState.EXPLORE,
+    "interact": BehaviorState.INTERACT,
+    "play": BehaviorState.PLAY,
+    "rest": BehaviorState.REST,
+}
+
+
 class BehaviorModule(Module):
     def __init__(self, name: str, enabled: bool = True, required: bool = False) -> None:
         super().__init__(name, enabled=enabled, required=required)
@@ -37,12 +52,16 @@ class BehaviorModule(Module):
         self._autonomy_mode: str | None = None
         self.library: BehaviorLibrary | None = None
         self.registry: BehaviorRegistry | None = None
+        # State -> action picker table, built once the library exists. IDLE is
+        # not listed because it goes through the weighted/sequential registry.
+        self._state_pickers: dict[BehaviorState, Callable[[], str]] = {}
         # habituation tracking: counts and last timestamp per stimulus type
         self._stim_counts: dict[str, int] = {}
         self._stim_last_ts: dict[str, float] = {}
 
     def tick(self, context) -> None:
         now = time.time()
+        all_settings = context.get("settings") or {}
         # Perception is fused upstream; behavior maps it to actions.
         perception = context.get("perception") or {}
         obstacle = perception.get("obstacle", False)
@@ -52,7 +71,7 @@ class BehaviorModule(Module):
         # Habituation: suppress repeated stimuli if enabled and threshold reached.
         # Settings: habituation_enabled (bool), habituation_threshold (int),
         # habituation_recovery_s (float) - time without stimulus to reset count.
-        hab_settings = (context.get("settings") or {}).get("behavior", {})
+        hab_settings = all_settings.get("behavior", {})
         hab_enabled = bool(hab_settings.get("habituation_enabled", False))
         suppressed = False
         if hab_enabled:
@@ -100,9 +119,9 @@ class BehaviorModule(Module):
                     pass
 
         # Behavior settings are centralized in settings.json for easy tuning.
-        settings = (context.get("settings") or {}).get("behavior", {})
+        settings = all_settings.get("behavior", {})
         # Energy / internal state: initialize, apply stimulus boosts, decay, and persist.
-        energy_settings = (context.get("settings") or {}).get("energy", {})
+        energy_settings = all_settings.get("energy", {})
         energy_enabled = bool(energy_settings.get("enabled", False))
         if energy_enabled:
             try:
@@ -186,6 +205,15 @@ class BehaviorModule(Module):
                     random_idle_chance=settings.get("random_idle_chance", 0.05),
                 )
             )
+            self._state_pickers = {
+                BehaviorState.AVOIDING: self.library.pick_avoid_action,
+                BehaviorState.ALERT: self.library.pick_alert_action,
+                BehaviorState.PATROL: self.library.pick_patrol_action,
+                BehaviorState.EXPLORE: self.library.pick_explore_action,
+                BehaviorState.INTERACT: self.library.pick_interact_action,
+                BehaviorState.PLAY: self.library.pick_play_action,
+                BehaviorState.REST: self.library.pick_rest_action,
+            }
         if self.registry is None:
             self.registry = BehaviorRegistry()
             self.registry.register("idle_behavior", self.library.pick_idle_action)
@@ -197,7 +225,7 @@ class BehaviorModule(Module):
                 "interact_behavior", self.library.pick_interact_action
             )
 
-        battery_settings = (context.get("settings") or {}).get("battery", {})
+        battery_settings = all_settings.get("battery", {})
         if battery_settings.get("enabled", False):
             voltage = context.get("battery_voltage")
             percent = context.get("battery_percent")
@@ -258,86 +286,46 @@ class BehaviorModule(Module):
         if override:
             desired_state = BehaviorState.IDLE
             desired_action = self._resolve_override(override)
-        elif obstacle:
-            desired_state = BehaviorState.AVOIDING
-            desired_action = (
-                self.library.pick_avoid_action() if self.library else avoid_action
-            )
-        elif touch != "N":
-            desired_state = BehaviorState.ALERT
-            desired_action = (
-                self.library.pick_alert_action() if self.library else touch_action
-            )
-        elif sound:
-            desired_state = BehaviorState.ALERT
-            desired_action = (
-                self.library.pick_alert_action() if self.library else sound_action
-            )
         else:
-            if settings.get("autonomy_enabled", True):
+            # Stimulus states share the per-state picker (and its no-library
+            # fallbacks) with the autonomy states.
+            if obstacle:
+                desired_state = BehaviorState.AVOIDING
+            elif touch != "N" or sound:
+                desired_state = BehaviorState.ALERT
+            elif settings.get("autonomy_enabled", True):
                 mode = self._select_autonomy_mode(settings, context)
-                if mode == "patrol":
-                    desired_state = BehaviorState.PATROL
-                    desired_action = (
-                        self.library.pick_patrol_action()
-                        if self.library
-                        else patrol_action
-                    )
-                elif mode == "explore":
-                    desired_state = BehaviorState.EXPLORE
-                    desired_action = (
-                        self.library.pick_explore_action()
-                        if self.library
-                        else explore_action
-                    )
-                elif mode == "interact":
-                    desired_state = BehaviorState.INTERACT
-                    desired_action = (
-                        self.library.pick_interact_action()
-                        if self.library
-                        else interact_action
-                    )
-                elif mode == "play":
-                    desired_state = BehaviorState.PLAY
-                    desired_action = (
-                        self.library.pick_play_action() if self.library else "stretch"
-                    )
-                elif mode == "rest":
-                    desired_state = BehaviorState.REST
-                    desired_action = (
-                        self.library.pick_rest_action() if self.library else "lie"
-                    )
-                else:
-                    desired_state = BehaviorState.IDLE
-                    desired_action = (
-                        self._select_idle_behavior(settings)
-                        if self.library
-                        else idle_action
-                    )
+                desired_state = _AUTONOMY_STATES.get(mode, BehaviorState.IDLE)
             else:
                 desired_state = BehaviorState.IDLE
-                desired_action = (
-                    self._select_idle_behavior(settings)
-                    if self.library
-                    else idle_action
-                )
-
-        transition_guard_enabled = bool(
-            settings.get("transition_guard_enabled", False)
-        )
-        if transition_guard_enabled:
-            immediate_states = settings.get(
-                "transition_immediate_states", ["avoiding", "alert"]
+            desired_action = self._pick_action_for_state(
+                desired_state,
+                settings,
+                idle_action,
+                touch_action,
+                sound_action,
+                avoid_action,
+                patrol_action,
+                explore_action,
+                interact_action,
+                touch,
+                sound,
             )
-            min_dwell_s = float(settings.get("transition_min_dwell_s", 0.6))
-            confirm_ticks = int(settings.get("transition_confirm_ticks", 2))
-            if desired_state != self.state:
+
+        # No-op transitions skip the guard settings entirely.
+        if desired_state != self.state:
+            if bool(settings.get("transition_guard_enabled", False)):
+                immediate_states = settings.get(
+                    "transition_immediate_states", ["avoiding", "alert"]
+                )
                 if override or desired_state.value in immediate_states:
                     self._candidate_state = None
                     self._candidate_ticks = 0
                     self.state = desired_state
                     self._last_state_ts = now
                 else:
+                    min_dwell_s = float(settings.get("transition_min_dwell_s", 0.6))
+                    confirm_ticks = int(settings.get("transition_confirm_ticks", 2))
                     if self._candidate_state != desired_state:
                         self._candidate_state = desired_state
                         self._candidate_ticks = 1
@@ -365,8 +353,7 @@ class BehaviorModule(Module):
                         self._candidate_ticks = 0
                         self.state = desired_state
                         self._last_state_ts = now
-        else:
-            if desired_state != self.state:
+            else:
                 self.state = desired_state
                 self._last_state_ts = now
 
@@ -382,10 +369,10 @@ class BehaviorModule(Module):
             and isinstance(micro_actions, list)
             and micro_actions
             and (now - self._last_micro_ts) >= micro_interval_s
-            and random.random() <= micro_chance
+            and _random() <= micro_chance
         ):
             try:
-                desired_action = str(random.choice(micro_actions))
+                desired_action = str(_choice(micro_actions))
                 self._last_micro_ts = now
             except Exception:
                 pass
@@ -399,7 +386,7 @@ class BehaviorModule(Module):
 
         if action != self.last_action:
             cooldown = float(settings.get("action_cooldown_s", 0.0))
-            quiet = (context.get("settings") or {}).get("quiet_mode", {})
+            quiet = all_settings.get("quiet_mode", {})
             if context.get("quiet_mode_active"):
                 try:
                     quiet_cooldown = float(quiet.get("behavior_action_cooldown_s", 0.0))
@@ -453,29 +440,22 @@ class BehaviorModule(Module):
         touch: str,
         sound: bool,
     ) -> str:
-        if state == BehaviorState.AVOIDING:
-            return self.library.pick_avoid_action() if self.library else avoid_action
-        if state == BehaviorState.ALERT:
-            if touch != "N":
-                return self.library.pick_alert_action() if self.library else touch_action
-            if sound:
-                return self.library.pick_alert_action() if self.library else sound_action
-            return self.library.pick_alert_action() if self.library else sound_action
-        if state == BehaviorState.PATROL:
-            return self.library.pick_patrol_action() if self.library else patrol_action
-        if state == BehaviorState.EXPLORE:
-            return self.library.pick_explore_action() if self.library else explore_action
-        if state == BehaviorState.INTERACT:
-            return self.library.pick_interact_action() if self.library else interact_action
-        if state == BehaviorState.PLAY:
-            return self.library.pick_play_action() if self.library else "stretch"
-        if state == BehaviorState.REST:
-            return self.library.pick_rest_action() if self.library else "lie"
-        return (
-            self._select_idle_behavior(settings)
-            if self.library
-            else idle_action
-        )
+        picker = self._state_pickers.get(state)
+        if picker is not None:
+            return picker()
+        if self.library is not None:
+            return self._select_idle_behavior(settings)
+        # No library yet: fall back to the raw configured actions.
+        fallbacks = {
+            BehaviorState.AVOIDING: avoid_action,
+            BehaviorState.ALERT: touch_action if touch != "N" else sound_action,
+            BehaviorState.PATROL: patrol_action,
+            BehaviorState.EXPLORE: explore_action,
+            BehaviorState.INTERACT: interact_action,
+            BehaviorState.PLAY: "stretch",
+            BehaviorState.REST: "lie",
+        }
+        return fallbacks.get(state, idle_action)
 
     def _select_autonomy_mode(self, settings, context) -> str:
         now = time.time()
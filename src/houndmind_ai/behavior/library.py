@@ -6,6 +6,21 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Bound methods of the shared module RNG; random.seed() still applies.
+_random = random.random
+_choice = random.choice
+_getrandbits = random.getrandbits
+
+
+def _pick(actions: list[str]) -> str:
+    """Pick a random action, skipping the RNG for the common 1-2 entry sets."""
+    count = len(actions)
+    if count == 1:
+        return actions[0]
+    if count == 2:
+        return actions[_getrandbits(1)]
+    return _choice(actions)
+
 
 @dataclass
 class BehaviorLibraryConfig:
@@ -31,28 +46,28 @@ class BehaviorLibrary:
     def pick_idle_action(self) -> str:
         """Pick a default idle action, occasionally adding variety."""
         if self.config.idle_actions:
-            if random.random() < self.config.random_idle_chance:
-                return random.choice(self.config.idle_actions)
+            if _random() < self.config.random_idle_chance:
+                return _pick(self.config.idle_actions)
             return self.config.idle_actions[0]
         return "stand"
 
     def pick_alert_action(self) -> str:
-        return random.choice(self.config.alert_actions)
+        return _pick(self.config.alert_actions)
 
     def pick_avoid_action(self) -> str:
-        return random.choice(self.config.avoid_actions)
+        return _pick(self.config.avoid_actions)
 
     def pick_play_action(self) -> str:
-        return random.choice(self.config.play_actions)
+        return _pick(self.config.play_actions)
 
     def pick_rest_action(self) -> str:
-        return random.choice(self.config.rest_actions)
+        return _pick(self.config.rest_actions)
 
     def pick_patrol_action(self) -> str:
-        return random.choice(self.config.patrol_actions)
+        return _pick(self.config.patrol_actions)
 
     def pick_explore_action(self) -> str:
-        return random.choice(self.config.explore_actions)
+        return _pick(self.config.explore_actions)
 
     def pick_interact_action(self) -> str:
-        return random.choice(self.config.interact_actions)
+        return _pick(self.config.interact_actions)
@@ -4,6 +4,11 @@ from dataclasses import dataclass
 import random
 from typing import Callable
 
+# Bound methods of the shared module RNG: skips the module attribute lookup
+# per call while still honouring random.seed().
+_random = random.random
+_choice = random.choice
+
 
 @dataclass
 class RegisteredBehavior:
@@ -34,8 +39,8 @@ class BehaviorRegistry:
         weight_list = [max(0.0, float(weights.get(name, 1.0))) for name in eligible]
         total = sum(weight_list)
         if total <= 0:
-            return random.choice(eligible)
-        roll = random.random() * total
+            return _choice(eligible)
+        roll = _random() * total
         acc = 0.0
         for name, weight in zip(eligible, weight_list):
             acc += weight
@@ -1,29 +1,43 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Generic, TypeVar
 from pathlib import Path
+import hashlib
 import json
 import logging
 import os
 import re
 
+try:
+    import json5  # type: ignore[import-not-found]
+except ImportError:  # Optional; the built-in JSONC sanitizer below is the fallback.
+    json5 = None  # type: ignore[assignment]
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # Optional speedup for the parse cache; stdlib json otherwise.
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
-@dataclass
+@dataclass(slots=True)
 class LoopConfig:
     tick_hz: int = 5
     max_cycles: int | None = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleConfig:
     enabled: bool = True
     required: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     loop: LoopConfig
     modules: dict[str, ModuleConfig]
@@ -62,6 +76,27 @@ class Config:
         return Config(loop=loop, modules=modules, settings=settings)
 
 
+class SettingsCache(Generic[_T]):
+    """Value derived from a settings dict, rebuilt only when the dict is replaced.
+
+    Settings are swapped wholesale on reload rather than edited in place, so
+    identity is enough to tell when the parsed value is stale.
+    """
+
+    __slots__ = ("_build", "_src", "_value")
+
+    def __init__(self, build: Callable[[dict], _T]) -> None:
+        self._build = build
+        self._src: dict | None = None
+        self._value: _T | None = None
+
+    def get(self, settings: dict) -> _T:
+        if self._value is None or settings is not self._src:
+            self._value = self._build(settings)
+            self._src = settings
+        return self._value
+
+
 def default_config_path() -> Path:
     repo_root = Path(__file__).resolve().parents[3]
     return repo_root / "config" / "settings.jsonc"
@@ -71,80 +106,133 @@ def _load_jsonc(path: Path) -> dict:
     raw_text = path.read_text(encoding="utf-8")
 
     # Prefer a robust third-party JSONC/JSON5 parser if available.
-    try:
-        import json5  # type: ignore
-
-        return json5.loads(raw_text)
-    except Exception:
-        # Fall back to the built-in sanitizer below. Provide clearer errors
-        # for common failure modes such as unterminated block comments.
-        if "/*" in raw_text and "*/" not in raw_text:
-            raise ValueError(
-                f"Unterminated block comment in config file: {path}. "
-                "Install 'json5' (pip install json5) to allow JSONC comments "
-                "or fix the comment block."
-            )
-
-        # Allow JSONC-style comments for user-friendly config files.
-        cleaned: list[str] = []
-        in_string = False
-        escape = False
-        i = 0
-        length = len(raw_text)
-        while i < length:
-            ch = raw_text[i]
-            nxt = raw_text[i + 1] if i + 1 < length else ""
-            if in_string:
-                cleaned.append(ch)
-                if escape:
-                    escape = False
-                elif ch == "\\":
-                    escape = True
-                elif ch == '"':
-                    in_string = False
-                i += 1
-                continue
+    if json5 is not None:
+        try:
+            return json5.loads(raw_text)
+        except Exception as exc:  # noqa: BLE001 - fall back to the sanitizer below
+            logger.debug("json5 could not parse %s, using sanitizer: %s", path, exc)
+
+    # Fall back to the built-in sanitizer below. Provide clearer errors
+    # for common failure modes such as unterminated block comments.
+    if "/*" in raw_text and "*/" not in raw_text:
+        raise ValueError(
+            f"Unterminated block comment in config file: {path}. "
+            "Install 'json5' (pip install json5) to allow JSONC comments "
+            "or fix the comment block."
+        )
 
-            if ch == '"':
-                in_string = True
-                cleaned.append(ch)
-                i += 1
-                continue
-
-            if ch == "/" and nxt == "/":
-                # Skip line comment.
-                i += 2
-                while i < length and raw_text[i] not in "\r\n":
-                    i += 1
-                continue
-            if ch == "/" and nxt == "*":
-                # Skip block comment.
-                i += 2
-                while i + 1 < length and not (
-                    raw_text[i] == "*" and raw_text[i + 1] == "/"
-                ):
-                    i += 1
-                i += 2
-                continue
+    # Allow JSONC-style comments for user-friendly config files.
+    cleaned: list[str] = []
+    in_string = False
+    escape = False
+    i = 0
+    length = len(raw_text)
+    while i < length:
+        ch = raw_text[i]
+        nxt = raw_text[i + 1] if i + 1 < length else ""
+        if in_string:
+            cleaned.append(ch)
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            i += 1
+            continue
 
+        if ch == '"':
+            in_string = True
             cleaned.append(ch)
             i += 1
+            continue
+
+        if ch == "/" and nxt == "/":
+            # Skip line comment.
+            i += 2
+            while i < length and raw_text[i] not in "\r\n":
+                i += 1
+            continue
+        if ch == "/" and nxt == "*":
+            # Skip block comment.
+            i += 2
+            while i + 1 < length and not (
+                raw_text[i] == "*" and raw_text[i + 1] == "/"
+            ):
+                i += 1
+            i += 2
+            continue
+
+        cleaned.append(ch)
+        i += 1
+
+    cleaned_text = "".join(cleaned)
+    # Remove trailing commas before closing braces/brackets.
+    cleaned_text = re.sub(r",\s*([}\]])", r"\1", cleaned_text)
+    return json.loads(cleaned_text)
+
+
+def _jsonc_cache_path(path: Path) -> Path:
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(base) / "houndmind" / f"config-{digest}.json"
 
-        cleaned_text = "".join(cleaned)
-        # Remove trailing commas before closing braces/brackets.
-        cleaned_text = re.sub(r",\s*([}\]])", r"\1", cleaned_text)
-        return json.loads(cleaned_text)
+
+def _load_jsonc_cached(path: Path) -> dict:
+    """Load a JSONC file via a plain-JSON cache keyed on its content hash.
+
+    Comment stripping (or json5) is the slow part of startup on a Pi; the cache
+    holds the already-parsed document so warm starts only pay for json.loads.
+    Hashing the file is cheap next to parsing it and, unlike mtime, does not
+    miss edits on filesystems with coarse timestamps.
+    Set HOUNDMIND_CONFIG_CACHE=0 to disable.
+    """
+    if os.getenv("HOUNDMIND_CONFIG_CACHE", "1") == "0":
+        return _load_jsonc(path)
+    try:
+        key = hashlib.sha1(path.read_bytes()).hexdigest()
+    except OSError:
+        return _load_jsonc(path)
+    cache_path = _jsonc_cache_path(path)
+    try:
+        blob = cache_path.read_bytes()
+        try:
+            cached = orjson.loads(blob) if orjson is not None else json.loads(blob)
+        except ValueError:  # orjson rejects the NaN/Infinity stdlib json writes.
+            cached = json.loads(blob)
+        if cached.get("key") == key and isinstance(cached.get("data"), dict):
+            return cached["data"]
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    raw = _load_jsonc(path)
+    payload = {"key": key, "data": raw}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        # Written with stdlib json: orjson would turn NaN/Infinity into null,
+        # and cache writes are rare enough that its speed does not matter.
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        logger.debug("Failed to write config cache %s", cache_path, exc_info=True)
+    return raw
 
 
 def load_config(path: Path | None = None) -> Config:
     config_path = path or default_config_path()
-    raw = _load_jsonc(config_path)
+    raw = _load_jsonc_cached(config_path)
     raw = _apply_profile_overrides(raw)
     config = Config.from_dict(raw)
 
-    warnings = validate_config(config)
-    for warning in warnings:
-        logger.warning("Config warning: %s", warning)
+    # Validation only feeds this startup report; skip it when it would be
+    # dropped, and emit all findings as one multi-line record.
+    if logger.isEnabledFor(logging.WARNING):
+        warnings = validate_config(config)
+        if warnings:
+            logger.warning(
+                "Config warnings (%d):\n  - %s", len(warnings), "\n  - ".join(warnings)
+            )
 
     # Optional: load action catalog from a dedicated file.
     behavior_settings = config.settings.get("behavior", {})
@@ -154,7 +242,7 @@ def load_config(path: Path | None = None) -> Config:
         if not actions_path.is_absolute():
             actions_path = config_path.parent / actions_file
         if actions_path.exists():
-            actions_raw = _load_jsonc(actions_path)
+            actions_raw = _load_jsonc_cached(actions_path)
             behavior_settings["catalog"] = actions_raw.get("catalog", {})
             config.settings["behavior"] = behavior_settings
             _ensure_action_sets(behavior_settings)
@@ -225,6 +313,150 @@ def _to_float(value: Any | None) -> float | None:
         return None
 
 
+# Single-value range checks: (section, key, is_invalid, message). Built once;
+# validate_config only looks up each key and appends the constant message.
+_VALUE_RULES: tuple[tuple[str, str, Callable[[float], bool], str], ...] = (
+    (
+        "navigation",
+        "stuck_time_window_s",
+        lambda v: v <= 0,
+        "navigation.stuck_time_window_s should be > 0",
+    ),
+    (
+        "navigation",
+        "stuck_movement_threshold",
+        lambda v: v <= 0,
+        "navigation.stuck_movement_threshold should be > 0",
+    ),
+    (
+        "navigation",
+        "stuck_min_samples",
+        lambda v: v < 3,
+        "navigation.stuck_min_samples should be >= 3",
+    ),
+    (
+        "navigation",
+        "scan_min_valid_points",
+        lambda v: v < 1,
+        "navigation.scan_min_valid_points should be >= 1",
+    ),
+    (
+        "navigation",
+        "scan_min_valid_ratio",
+        lambda v: not (0 < v <= 1),
+        "navigation.scan_min_valid_ratio should be in (0, 1]",
+    ),
+    (
+        "navigation",
+        "turn_confidence_min",
+        lambda v: not (0 < v <= 1),
+        "navigation.turn_confidence_min should be in (0, 1]",
+    ),
+    (
+        "navigation",
+        "low_confidence_cooldown_s",
+        lambda v: v < 0,
+        "navigation.low_confidence_cooldown_s should be >= 0",
+    ),
+    (
+        "navigation",
+        "scan_retry_limit",
+        lambda v: v < 0,
+        "navigation.scan_retry_limit should be >= 0",
+    ),
+    (
+        "movement",
+        "speed_normal",
+        lambda v: v < 0,
+        "movement.speed_normal should be >= 0",
+    ),
+    (
+        "movement",
+        "speed_normal",
+        lambda v: v > 255,
+        "movement.speed_normal exceeds servo limit (255)",
+    ),
+    (
+        "movement",
+        "speed_turn_normal",
+        lambda v: v < 0,
+        "movement.speed_turn_normal should be >= 0",
+    ),
+    (
+        "movement",
+        "speed_turn_normal",
+        lambda v: v > 255,
+        "movement.speed_turn_normal exceeds servo limit (255)",
+    ),
+    (
+        "logging",
+        "log_max_entries",
+        lambda v: v > 5000,
+        "logging.log_max_entries is large and may use significant memory",
+    ),
+    (
+        "safety",
+        "emergency_stop_cm",
+        lambda v: v <= 0,
+        "safety.emergency_stop_cm should be > 0",
+    ),
+    (
+        "safety",
+        "emergency_stop_cooldown_s",
+        lambda v: v < 0,
+        "safety.emergency_stop_cooldown_s should be >= 0",
+    ),
+    (
+        "attention",
+        "head_yaw_max_deg",
+        lambda v: not (0 < v <= 90),
+        "attention.head_yaw_max_deg should be in (0, 90]",
+    ),
+    (
+        "attention",
+        "sound_cooldown_s",
+        lambda v: v < 0,
+        "attention.sound_cooldown_s should be >= 0",
+    ),
+    (
+        "attention",
+        "scan_block_s",
+        lambda v: v < 0,
+        "attention.scan_block_s should be >= 0",
+    ),
+    (
+        "balance",
+        "update_hz",
+        lambda v: v < 0,
+        "balance.update_hz should be >= 0",
+    ),
+    (
+        "balance",
+        "compensation_scale",
+        lambda v: v < 0,
+        "balance.compensation_scale should be >= 0",
+    ),
+    (
+        "balance",
+        "max_pitch_deg",
+        lambda v: v <= 0,
+        "balance.max_pitch_deg should be > 0",
+    ),
+    (
+        "balance",
+        "max_roll_deg",
+        lambda v: v <= 0,
+        "balance.max_roll_deg should be > 0",
+    ),
+    (
+        "balance",
+        "lpf_alpha",
+        lambda v: not (0 < v <= 1.0),
+        "balance.lpf_alpha should be in (0, 1]",
+    ),
+)
+
+
 def validate_config(config: Config) -> list[str]:
     warnings: list[str] = []
     if config.loop.tick_hz <= 0:
@@ -236,11 +468,14 @@ def validate_config(config: Config) -> list[str]:
     navigation = settings.get("navigation", {})
     movement = settings.get("movement", {})
     performance = settings.get("performance", {})
-    logging_settings = settings.get("logging", {})
     safety = settings.get("safety", {})
-    attention = settings.get("attention", {})
-    balance = settings.get("balance", {})
 
+    for section, key, is_invalid, message in _VALUE_RULES:
+        value = _to_float(settings.get(section, {}).get(key))
+        if value is not None and is_invalid(value):
+            warnings.append(message)
+
+    # Cross-field and type checks.
     min_cm = _to_float(sensors.get("distance_min_cm"))
     max_cm = _to_float(sensors.get("distance_max_cm"))
     if min_cm is not None and max_cm is not None and min_cm >= max_cm:
@@ -287,45 +522,8 @@ def validate_config(config: Config) -> list[str]:
             "navigation.min_distance_cm should be less than safe_distance_cm"
         )
 
-    stuck_window = _to_float(navigation.get("stuck_time_window_s"))
-    stuck_threshold = _to_float(navigation.get("stuck_movement_threshold"))
-    stuck_samples = _to_float(navigation.get("stuck_min_samples"))
-    if stuck_window is not None and stuck_window <= 0:
-        warnings.append("navigation.stuck_time_window_s should be > 0")
-    if stuck_threshold is not None and stuck_threshold <= 0:
-        warnings.append("navigation.stuck_movement_threshold should be > 0")
-    if stuck_samples is not None and stuck_samples < 3:
-        warnings.append("navigation.stuck_min_samples should be >= 3")
-
-    min_valid_points = _to_float(navigation.get("scan_min_valid_points"))
-    min_valid_ratio = _to_float(navigation.get("scan_min_valid_ratio"))
-    if min_valid_points is not None and min_valid_points < 1:
-        warnings.append("navigation.scan_min_valid_points should be >= 1")
-    if min_valid_ratio is not None and not (0 < min_valid_ratio <= 1):
-        warnings.append("navigation.scan_min_valid_ratio should be in (0, 1]")
-
-    turn_confidence_min = _to_float(navigation.get("turn_confidence_min"))
-    if turn_confidence_min is not None and not (0 < turn_confidence_min <= 1):
-        warnings.append("navigation.turn_confidence_min should be in (0, 1]")
-
-    low_confidence_cooldown = _to_float(navigation.get("low_confidence_cooldown_s"))
-    if low_confidence_cooldown is not None and low_confidence_cooldown < 0:
-        warnings.append("navigation.low_confidence_cooldown_s should be >= 0")
-
-    retry_limit = _to_float(navigation.get("scan_retry_limit"))
-    if retry_limit is not None and retry_limit < 0:
-        warnings.append("navigation.scan_retry_limit should be >= 0")
-
     speed_normal = _to_float(movement.get("speed_normal"))
     speed_turn_normal = _to_float(movement.get("speed_turn_normal"))
-    if speed_normal is not None and speed_normal < 0:
-        warnings.append("movement.speed_normal should be >= 0")
-    if speed_normal is not None and speed_normal > 255:
-        warnings.append("movement.speed_normal exceeds servo limit (255)")
-    if speed_turn_normal is not None and speed_turn_normal < 0:
-        warnings.append("movement.speed_turn_normal should be >= 0")
-    if speed_turn_normal is not None and speed_turn_normal > 255:
-        warnings.append("movement.speed_turn_normal exceeds servo limit (255)")
     if (
         speed_normal is not None
         and speed_turn_normal is not None
@@ -333,12 +531,6 @@ def validate_config(config: Config) -> list[str]:
     ):
         warnings.append("movement.speed_turn_normal should be faster than speed_normal")
 
-    log_max_entries = _to_float(logging_settings.get("log_max_entries"))
-    if log_max_entries is not None and log_max_entries > 5000:
-        warnings.append(
-            "logging.log_max_entries is large and may use significant memory"
-        )
-
     override_priority = safety.get("override_priority")
     if override_priority is not None and not isinstance(override_priority, list):
         warnings.append("safety.override_priority should be a list")
@@ -347,44 +539,11 @@ def validate_config(config: Config) -> list[str]:
     override_clear_lower = safety.get("override_clear_lower")
     if override_clear_lower is not None and not isinstance(override_clear_lower, bool):
         warnings.append("safety.override_clear_lower should be a boolean")
-    # Emergency stop validation
     emergency_enabled = safety.get("emergency_stop_enabled")
     if emergency_enabled is not None and not isinstance(emergency_enabled, bool):
         warnings.append("safety.emergency_stop_enabled should be a boolean")
-    emergency_cm = _to_float(safety.get("emergency_stop_cm"))
-    if emergency_cm is not None and emergency_cm <= 0:
-        warnings.append("safety.emergency_stop_cm should be > 0")
-    emergency_cool = _to_float(safety.get("emergency_stop_cooldown_s"))
-    if emergency_cool is not None and emergency_cool < 0:
-        warnings.append("safety.emergency_stop_cooldown_s should be >= 0")
     emergency_action = safety.get("emergency_stop_action")
     if emergency_action is not None and not isinstance(emergency_action, str):
         warnings.append("safety.emergency_stop_action should be a string action name")
 
-    head_yaw_max = _to_float(attention.get("head_yaw_max_deg"))
-    if head_yaw_max is not None and not (0 < head_yaw_max <= 90):
-        warnings.append("attention.head_yaw_max_deg should be in (0, 90]")
-    attention_cooldown = _to_float(attention.get("sound_cooldown_s"))
-    if attention_cooldown is not None and attention_cooldown < 0:
-        warnings.append("attention.sound_cooldown_s should be >= 0")
-    scan_block = _to_float(attention.get("scan_block_s"))
-    if scan_block is not None and scan_block < 0:
-        warnings.append("attention.scan_block_s should be >= 0")
-
-    balance_update_hz = _to_float(balance.get("update_hz"))
-    if balance_update_hz is not None and balance_update_hz < 0:
-        warnings.append("balance.update_hz should be >= 0")
-    balance_scale = _to_float(balance.get("compensation_scale"))
-    if balance_scale is not None and balance_scale < 0:
-        warnings.append("balance.compensation_scale should be >= 0")
-    balance_max_pitch = _to_float(balance.get("max_pitch_deg"))
-    if balance_max_pitch is not None and balance_max_pitch <= 0:
-        warnings.append("balance.max_pitch_deg should be > 0")
-    balance_max_roll = _to_float(balance.get("max_roll_deg"))
-    if balance_max_roll is not None and balance_max_roll <= 0:
-        warnings.append("balance.max_roll_deg should be > 0")
-    balance_lpf = _to_float(balance.get("lpf_alpha"))
-    if balance_lpf is not None and not (0 < balance_lpf <= 1.0):
-        warnings.append("balance.lpf_alpha should be in (0, 1]")
-
     return warnings
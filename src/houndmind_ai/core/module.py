@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -60,6 +61,20 @@ class Module:
     def tick(self, context: "RuntimeContext") -> None:
         return None
 
+    def stop_timeout(
+        self, context: RuntimeContext, default: float, minimum: float = 0.0
+    ) -> float:
+        """Seconds stop() may block, capped by the runtime's shutdown deadline.
+
+        ``minimum`` is granted even after the deadline has passed, so modules
+        that own hardware still get to join the threads using it.
+        """
+        deadline = context.get("shutdown_deadline")
+        if not isinstance(deadline, (int, float)):
+            return default
+        remaining = deadline - time.monotonic()
+        return max(minimum, min(default, remaining))
+
     def disable(self, reason: str) -> None:
         self.status.enabled = False
         self.status.started = False
@@ -35,50 +35,82 @@ class HoundMindRuntime:
         # Generate a per-runtime trace id for correlating logs and telemetry.
         trace_id = uuid.uuid4().hex
         self.context.set("trace_id", trace_id)
+        # Per-module context keys, formatted once instead of on every tick.
+        self._module_keys: dict[str, tuple[str, str]] = {}
 
     def start(self) -> None:
-        for module in self.modules:
-            if not module.status.enabled:
-                continue
-            try:
-                module.start(self.context)
-                module.status.started = True
-                logger.info("Started module: %s", module.name)
-            except Exception as exc:  # noqa: BLE001 - capture hardware failures
-                logger.exception("Failed to start module: %s", module.name)
-                if module.status.required:
-                    raise ModuleError(f"Required module failed: {module.name}") from exc
-                module.disable(str(exc))
+        # Collect names and log one record for the whole start sequence, even
+        # when a required module aborts it part way.
+        started: list[str] = []
+        try:
+            for module in self.modules:
+                if not module.status.enabled:
+                    continue
+                try:
+                    module.start(self.context)
+                    module.status.started = True
+                    started.append(module.name)
+                except Exception as exc:  # noqa: BLE001 - capture hardware failures
+                    logger.exception("Failed to start module: %s", module.name)
+                    if module.status.required:
+                        raise ModuleError(
+                            f"Required module failed: {module.name}"
+                        ) from exc
+                    module.disable(str(exc))
+        finally:
+            if started:
+                logger.info(
+                    "Started modules (%d): %s", len(started), ", ".join(started)
+                )
 
     def stop(self) -> None:
-        for module in self.modules:
-            if module.status.started:
-                try:
-                    module.stop(self.context)
-                except Exception:  # noqa: BLE001
-                    logger.exception("Failed to stop module %s", module.name)
+        # Stop in reverse start order so hardware owners (sensors/motors) outlive
+        # the modules that still drive their services; calling stop twice is a no-op.
+        # Thread joins share one deadline so slow services cannot add up.
+        perf = (self.config.settings or {}).get("performance", {})
+        budget = float(perf.get("shutdown_timeout_s", 3.0))
+        self.context.set("shutdown_deadline", time.monotonic() + budget)
+        stopped: list[str] = []
+        for module in reversed(self.modules):
+            if not module.status.started:
+                continue
+            module.status.started = False
+            try:
+                module.stop(self.context)
+                stopped.append(module.name)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to stop module %s", module.name)
+        self.context.set("shutdown_deadline", None)
+        if stopped:
+            logger.info("Stopped modules (%d): %s", len(stopped), ", ".join(stopped))
 
     def tick(self) -> None:
         self.context.set("watchdog_heartbeat_ts", time.time())
         self._update_quiet_mode()
         per_module_durations: dict[str, float] = {}
+        # A module's tick may use at most the whole loop budget.
+        budget = 1.0 / max(1, self.config.loop.tick_hz)
         for module in self.modules:
             if module.status.started:
                 try:
                     m_start = time.time()
                     module.tick(self.context)
-                    m_elapsed = time.time() - m_start
                     # Record module heartbeat, timing and health.
                     now = time.time()
+                    m_elapsed = now - m_start
                     module.status.last_tick_ts = now
                     module.status.last_heartbeat_ts = now
                     module.status.last_tick_duration_s = m_elapsed
                     per_module_durations[module.name] = m_elapsed
-                    self.context.set(f"module_heartbeat:{module.name}", now)
-                    self.context.set(f"module_tick_duration:{module.name}", m_elapsed)
+                    keys = self._module_keys.get(module.name)
+                    if keys is None:
+                        keys = self._module_keys[module.name] = (
+                            f"module_heartbeat:{module.name}",
+                            f"module_tick_duration:{module.name}",
+                        )
+                    self.context.set(keys[0], now)
+                    self.context.set(keys[1], m_elapsed)
                     # Log a warning if a module's tick consumed the whole loop budget.
-                    loop_hz = max(1, self.config.loop.tick_hz)
-                    budget = 1.0 / loop_hz
                     if m_elapsed > budget:
                         logger.warning(
                             "Module tick overrun: %s took %.3fs (budget %.3fs)",
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import json
 import logging
 import time
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Optional
 
 from houndmind_ai.calibration.servo_calibration import apply_servo_offsets
+from houndmind_ai.core.config import SettingsCache
 from houndmind_ai.core.module import Module
 
 logger = logging.getLogger(__name__)
 
+# Yaw sign per turn direction (positive yaw turns left).
+_TURN_SIGN = {"left": 1.0, "right": -1.0}
+# Queued turn action -> head-follow direction.
+_TURN_ACTION_DIRECTION = {"turn left": "left", "turn right": "right"}
+# Heading poll period while turning to an angle (seconds).
+_TURN_POLL_S = 0.05
+
 
 def _safe_float(val: Any, default: float) -> float:
     try:
@@ -28,6 +39,70 @@ def _safe_int(val: Any, default: int) -> int:
         return default
 
 
+@dataclass(frozen=True)
+class _TurnParams:
+    degrees_per_step: float
+    tolerance_deg: float
+    timeout_s: float
+    speed_normal: int
+    # Turn speed per energy_speed_hint bucket; other hints use speed_normal.
+    speed_by_hint: dict[str, int]
+
+    @staticmethod
+    def from_settings(settings: dict) -> _TurnParams:
+        movement = settings.get("movement", {})
+        orientation = settings.get("orientation", {})
+        perf = settings.get("performance", {})
+        speed = _safe_int(movement.get("speed_turn_normal", 200), 200)
+        if bool(perf.get("safe_mode_enabled", False)):
+            speed = _safe_int(perf.get("safe_mode_turn_speed", speed), speed)
+        return _TurnParams(
+            degrees_per_step=_safe_float(
+                movement.get("turn_degrees_per_step", 15.0), 15.0
+            ),
+            tolerance_deg=_safe_float(orientation.get("turn_tolerance_deg", 5.0), 5.0),
+            timeout_s=_safe_float(orientation.get("turn_timeout_s", 3.0), 3.0),
+            speed_normal=speed,
+            speed_by_hint={
+                "fast": _safe_int(movement.get("speed_turn_fast", speed), speed),
+                "slow": _safe_int(movement.get("speed_turn_slow", speed), speed),
+            },
+        )
+
+
+@dataclass(frozen=True)
+class _HeadFollowParams:
+    enabled: bool
+    degrees: float
+    speed: int
+    hold_s: float
+    # Block windows after a scan / attention move; 0 when not respected.
+    scan_block_s: float
+    attention_block_s: float
+
+    @staticmethod
+    def from_settings(settings: dict) -> _HeadFollowParams:
+        motors = settings.get("motors", {})
+        scan_block_s = 0.0
+        if bool(motors.get("head_turn_follow_respect_scanning", True)):
+            scan_block_s = _safe_float(
+                motors.get("head_turn_follow_scan_block_s", 0.4), 0.4
+            )
+        attention_block_s = 0.0
+        if bool(motors.get("head_turn_follow_respect_attention", True)):
+            attention_block_s = _safe_float(
+                motors.get("head_turn_follow_attention_block_s", 0.6), 0.6
+            )
+        return _HeadFollowParams(
+            enabled=bool(motors.get("head_turn_follow_enabled", True)),
+            degrees=_safe_float(motors.get("head_turn_follow_deg", 0.0), 0.0),
+            speed=_safe_int(motors.get("head_turn_follow_speed", 70), 70),
+            hold_s=_safe_float(motors.get("head_turn_follow_hold_s", 0.4), 0.4),
+            scan_block_s=scan_block_s,
+            attention_block_s=attention_block_s,
+        )
+
+
 class MotorModule(Module):
     def __init__(self, name: str, enabled: bool = True, required: bool = False) -> None:
         super().__init__(name, enabled=enabled, required=required)
@@ -35,6 +110,8 @@ class MotorModule(Module):
         self.last_action: str | None = None
         self.action_flow: Optional[Any] = None
         self.last_action_ts = 0.0
+        self._turn_params = SettingsCache(_TurnParams.from_settings)
+        self._head_params = SettingsCache(_HeadFollowParams.from_settings)
 
     def start(self, context) -> None:
         if not self.status.enabled:
@@ -83,15 +160,16 @@ class MotorModule(Module):
             return
 
         # Configurable cooldown keeps actions from spamming the action queue.
-        settings = (context.get("settings") or {}).get("motors", {})
+        all_settings = context.get("settings") or {}
+        settings = all_settings.get("motors", {})
         min_interval = _safe_float(settings.get("min_action_interval_s", 0.2), 0.2)
-        quiet = (context.get("settings") or {}).get("quiet_mode", {})
+        quiet = all_settings.get("quiet_mode", {})
         if context.get("quiet_mode_active"):
             quiet_interval = _safe_float(
                 quiet.get("motor_min_action_interval_s", min_interval), min_interval
             )
             min_interval = max(min_interval, quiet_interval)
-        safety_settings = (context.get("settings") or {}).get("safety", {})
+        safety_settings = all_settings.get("safety", {})
         if context.get("emergency_stop_active") and safety_settings.get(
             "emergency_stop_use_hardware_stop", False
         ):
@@ -109,9 +187,9 @@ class MotorModule(Module):
                     self.last_action_ts = now
                     return
 
-            if action in ("turn left", "turn right"):
-                direction = "left" if action == "turn left" else "right"
-                self._schedule_head_follow(context, direction)
+            turn_direction = _TURN_ACTION_DIRECTION.get(action)
+            if turn_direction is not None:
+                self._schedule_head_follow(context, turn_direction)
 
             # Execute action; optionally follow with a retreat/turn sequence.
             self.action_flow.add_action(action)
@@ -155,60 +233,63 @@ class MotorModule(Module):
         degrees = payload.get("degrees")
         steps = _safe_int(payload.get("steps", 1), 1)
 
-        settings = context.get("settings") or {}
-        movement = settings.get("movement", {})
-        orientation = settings.get("orientation", {})
-        perf = settings.get("performance", {})
-        safe_mode = bool(perf.get("safe_mode_enabled", False))
-        degrees_per_step = _safe_float(movement.get("turn_degrees_per_step", 15.0), 15.0)
+        params = self._turn_params.get(context.get("settings") or {})
+        degrees_per_step = params.degrees_per_step
         if degrees is None:
             degrees = degrees_per_step * steps
-        degrees = _safe_float(degrees, degrees_per_step * steps)
-        if direction == "right":
-            degrees = -degrees
+        degrees = _safe_float(degrees, degrees_per_step * steps) * _TURN_SIGN.get(
+            direction, 1.0
+        )
 
-        tolerance = _safe_float(orientation.get("turn_tolerance_deg", 5.0), 5.0)
-        timeout_s = _safe_float(orientation.get("turn_timeout_s", 3.0), 3.0)
-        speed = _safe_int(movement.get("speed_turn_normal", 200), 200)
-        if safe_mode:
-            speed = _safe_int(perf.get("safe_mode_turn_speed", speed), speed)
+        tolerance = params.tolerance_deg
+        timeout_s = params.timeout_s
         hint = context.get("energy_speed_hint")
-        if hint == "fast":
-            speed = _safe_int(movement.get("speed_turn_fast", speed), speed)
-        elif hint == "slow":
-            speed = _safe_int(movement.get("speed_turn_slow", speed), speed)
+        speed = (
+            params.speed_by_hint.get(hint, params.speed_normal)
+            if isinstance(hint, str)
+            else params.speed_normal
+        )
 
-        def ang_diff(a: float, b: float) -> float:
-            d = (a - b + 180.0) % 360.0 - 180.0
-            return d
+        # Bound once: the loop below polls heading every step until timeout.
+        do_action = getattr(self.dog, "do_action", None)
+        if do_action is None:
+            return False
+        dog = self.dog
+        wait_all_done = getattr(dog, "wait_all_done", None)
+        get = context.get
 
         start = _safe_float(heading, 0.0)
         target = (start + degrees) % 360.0
-        end_time = time.time() + timeout_s
+        # Monotonic deadline: immune to wall-clock steps (NTP) mid-turn.
+        end_time = time.monotonic() + timeout_s
 
         self._apply_head_follow(direction, context)
 
-        while time.time() < end_time:
-            current = _safe_float(context.get("current_heading"), start)
-            remaining = ang_diff(target, current)
-            if abs(remaining) <= tolerance:
-                self._apply_head_center(context)
-                return True
-            step_dir = "turn left" if remaining > 0 else "turn right"
-            try:
-                dog = self.dog
-                if dog is None:
+        # One handler around the whole loop: any servo failure aborts the turn.
+        next_poll = time.monotonic()
+        try:
+            while time.monotonic() < end_time:
+                current = get("current_heading")
+                # Orientation publishes floats; only coerce anything else.
+                if type(current) is not float:
+                    current = _safe_float(current, start)
+                # Signed shortest angle from current to target, in [-180, 180).
+                remaining = (target - current + 180.0) % 360.0 - 180.0
+                if abs(remaining) <= tolerance:
                     self._apply_head_center(context)
-                    return False
-                dog.do_action(
-                    step_dir.replace("turn ", "turn_"), step_count=1, speed=speed
-                )
-                if hasattr(dog, "wait_all_done"):
-                    dog.wait_all_done()
-            except Exception:  # noqa: BLE001
-                self._apply_head_center(context)
-                return False
-            time.sleep(0.05)
+                    return True
+                step_action = "turn_left" if remaining > 0 else "turn_right"
+                do_action(step_action, step_count=1, speed=speed)
+                if wait_all_done is not None:
+                    wait_all_done()
+                # Fixed-rate polling: the step's own duration counts toward the
+                # period; a step that overran it starts the next poll at once.
+                now = time.monotonic()
+                next_poll = max(next_poll + _TURN_POLL_S, now)
+                time.sleep(next_poll - now)
+        except Exception:  # noqa: BLE001
+            self._apply_head_center(context)
+            return False
         self._apply_head_center(context)
         return False
 
@@ -239,101 +320,54 @@ class MotorModule(Module):
             except Exception:  # noqa: BLE001
                 pass
 
-    def _head_follow_config(
-        self, context
-    ) -> tuple[bool, float, int, float, bool, float, bool, float]:
-        settings = (context.get("settings") or {}).get("motors", {})
-        enabled = bool(settings.get("head_turn_follow_enabled", True))
-        degrees = _safe_float(settings.get("head_turn_follow_deg", 0.0), 0.0)
-        speed = _safe_int(settings.get("head_turn_follow_speed", 70), 70)
-        hold_s = _safe_float(settings.get("head_turn_follow_hold_s", 0.4), 0.4)
-        respect_scanning = bool(settings.get("head_turn_follow_respect_scanning", True))
-        scan_block_s = _safe_float(settings.get("head_turn_follow_scan_block_s", 0.4), 0.4)
-        respect_attention = bool(
-            settings.get("head_turn_follow_respect_attention", True)
-        )
-        attention_block_s = _safe_float(
-            settings.get("head_turn_follow_attention_block_s", 0.6), 0.6
-        )
-        return (
-            enabled,
-            degrees,
-            speed,
-            hold_s,
-            respect_scanning,
-            scan_block_s,
-            respect_attention,
-            attention_block_s,
-        )
-
-    def _head_follow_blocked(self, context) -> bool:
-        (
-            _,
-            _,
-            _,
-            _,
-            respect_scanning,
-            scan_block_s,
-            respect_attention,
-            attention_block_s,
-        ) = self._head_follow_config(context)
-        if not respect_scanning:
-            scan_block_s = 0.0
-        if not respect_attention:
-            attention_block_s = 0.0
-        blocked = False
-        if scan_block_s > 0:
+    def _head_follow_blocked(self, context, params: _HeadFollowParams) -> bool:
+        now = time.time()
+        if params.scan_block_s > 0:
             scan_reading = context.get("scan_reading")
-            scan_ts = _safe_float(getattr(scan_reading, "timestamp", 0.0) if scan_reading else 0.0, 0.0)
-            blocked = blocked or (time.time() - scan_ts) < max(0.0, scan_block_s)
-        if attention_block_s > 0:
+            scan_ts = _safe_float(
+                getattr(scan_reading, "timestamp", 0.0) if scan_reading else 0.0, 0.0
+            )
+            if now - scan_ts < params.scan_block_s:
+                return True
+        if params.attention_block_s > 0:
             attention_ts = context.get("attention_active_ts")
-            try:
-                attention_ts = _safe_float(attention_ts, 0.0) if attention_ts is not None else 0.0
-            except Exception:
-                attention_ts = 0.0
-            blocked = blocked or (time.time() - attention_ts) < max(
-                0.0, attention_block_s
+            attention_ts = (
+                _safe_float(attention_ts, 0.0) if attention_ts is not None else 0.0
             )
-        return blocked
+            if now - attention_ts < params.attention_block_s:
+                return True
+        return False
 
     def _apply_head_follow(self, direction: str, context) -> None:
-        if self.dog is None or not hasattr(self.dog, "head_move"):
-            return
-        enabled, degrees, speed, _, _, _, _, _ = self._head_follow_config(context)
-        if not enabled or degrees <= 0:
-            return
-        if self._head_follow_blocked(context):
-            return
-        yaw = degrees if direction == "left" else -degrees
-        try:
-            self.dog.head_move([[yaw, 0, 0]], speed=speed)
-            if hasattr(self.dog, "wait_head_done"):
-                self.dog.wait_head_done()
-        except Exception:  # noqa: BLE001
-            return
+        self._move_head(context, _TURN_SIGN.get(direction, -1.0))
 
     def _apply_head_center(self, context) -> None:
+        self._move_head(context, 0.0)
+
+    def _move_head(self, context, sign: float) -> None:
+        """Turn the head to sign * head_turn_follow_deg (0 centers it)."""
         if self.dog is None or not hasattr(self.dog, "head_move"):
             return
-        enabled, _, speed, _, _, _, _, _ = self._head_follow_config(context)
-        if not enabled:
+        params = self._head_params.get(context.get("settings") or {})
+        if not params.enabled or (sign and params.degrees <= 0):
             return
-        if self._head_follow_blocked(context):
+        if self._head_follow_blocked(context, params):
             return
         try:
-            self.dog.head_move([[0, 0, 0]], speed=speed)
+            self.dog.head_move([[params.degrees * sign, 0, 0]], speed=params.speed)
             if hasattr(self.dog, "wait_head_done"):
                 self.dog.wait_head_done()
         except Exception:  # noqa: BLE001
             return
 
     def _schedule_head_follow(self, context, direction: str) -> None:
-        enabled, degrees, _, hold_s, _, _, _, _ = self._head_follow_config(context)
-        if not enabled or degrees <= 0:
+        params = self._head_params.get(context.get("settings") or {})
+        if not params.enabled or params.degrees <= 0:
             return
         self._apply_head_follow(direction, context)
-        context.set("head_turn_follow_release_ts", time.time() + max(0.0, hold_s))
+        context.set(
+            "head_turn_follow_release_ts", time.time() + max(0.0, params.hold_s)
+        )
 
     def _release_head_follow_if_due(self, context) -> None:
         release_ts = context.get("head_turn_follow_release_ts")
@@ -348,9 +382,6 @@ class MotorModule(Module):
             self._apply_head_center(context)
 
     def _apply_persisted_offsets(self, calibration: dict) -> None:
-        from pathlib import Path
-        import json
-
         path = Path(str(calibration.get("persist_path", "data/calibration.json")))
         if not path.is_absolute():
             path = Path(__file__).resolve().parents[3] / path
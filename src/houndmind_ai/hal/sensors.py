@@ -30,7 +30,7 @@ def _safe_int(val: Any, default: int) -> int:
         return default
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorReading:
     distance_cm: float | None
     touch: str
@@ -77,6 +77,8 @@ class SensorService:
         self._last_distance: float | None = None
         self._last_distance_ts = 0.0
         self._ema_distance: float | None = None
+        # Ultrasonic entry point, resolved on first use instead of per sample.
+        self._distance_reader: Callable[[], Any] | None = None
         self._acc_lpf: tuple[float, float, float] | None = None
         self._gyro_lpf: tuple[float, float, float] | None = None
 
@@ -87,10 +89,13 @@ class SensorService:
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
-    def stop(self, timeout: float = 2.0) -> None:
+    def stop(self, timeout: float = 2.0) -> bool:
+        """Stop polling; return True once the poll thread has exited."""
         self._stop.set()
         if self._thread:
             self._thread.join(timeout=timeout)
+            return not self._thread.is_alive()
+        return True
 
     def subscribe(self, callback: Callable[[SensorReading], None]) -> None:
         self._callbacks.append(callback)
@@ -108,8 +113,8 @@ class SensorService:
 
     def _loop(self) -> None:
         interval = 1.0 / max(1.0, _safe_float(self._settings.get("poll_hz", 10), 10.0))
+        next_poll = time.monotonic()
         while not self._stop.is_set():
-            start = time.time()
             reading = self._read_once()
             if reading:
                 with self._lock:
@@ -124,8 +129,13 @@ class SensorService:
                         cb(reading)
                     except Exception:  # noqa: BLE001
                         logger.debug("Sensor callback failed", exc_info=True)
-            elapsed = time.time() - start
-            time.sleep(max(0.0, interval - elapsed))
+            # Fixed-rate schedule on the monotonic clock so sleep overshoot does
+            # not accumulate; a poll that overran its slot resyncs, not bursts.
+            now = time.monotonic()
+            next_poll = max(next_poll + interval, now)
+            # Waiting on the stop event lets stop() return without sitting out
+            # the rest of the poll period.
+            self._stop.wait(next_poll - now)
 
     def _history_size(self) -> int:
         return max(1, _safe_int(self._settings.get("history_size", 10), 10))
@@ -189,10 +199,16 @@ class SensorService:
         values: list[float] = []
         for _ in range(samples):
             try:
-                if hasattr(self._dog, "read_distance"):
-                    value = float(self._dog.read_distance())
-                else:
-                    value = float(self._dog.ultrasonic.read_distance())
+                reader = self._distance_reader
+                if reader is None:
+                    dog = self._dog
+                    reader = (
+                        dog.read_distance
+                        if hasattr(dog, "read_distance")
+                        else dog.ultrasonic.read_distance
+                    )
+                    self._distance_reader = reader
+                value = float(reader())
             except Exception:  # noqa: BLE001
                 logger.debug("Ultrasonic read failed", exc_info=True)
                 value = None
@@ -330,6 +346,7 @@ class SensorModule(Module):
             return
         latest = self.service.latest()
         if latest is not None:
+            now = time.time()
             context.set("sensor_reading", latest)
             context.set("sensors", latest.to_dict())
             context.set("sensor_history", self.service.history())
@@ -337,7 +354,7 @@ class SensorModule(Module):
                 "sensor_health",
                 {
                     "timestamp": latest.timestamp,
-                    "age_s": max(0.0, time.time() - _safe_float(latest.timestamp, time.time())),
+                    "age_s": max(0.0, now - _safe_float(latest.timestamp, now)),
                     "distance_valid": latest.distance_valid,
                     "touch_valid": latest.touch_valid,
                     "sound_valid": latest.sound_valid,
@@ -346,9 +363,16 @@ class SensorModule(Module):
             )
 
     def stop(self, context) -> None:
+        stopped = True
         if self.service:
-            self.service.stop()
+            stopped = self.service.stop(
+                timeout=self.stop_timeout(context, 2.0, minimum=1.0)
+            )
             self.service = None
+        if not stopped:
+            # Closing under a hardware read would crash the poll thread mid-I/O.
+            logger.warning("Sensor poll thread still running; leaving Pidog open")
+            return
         dog_owner = context.get("pidog_owner")
         if dog_owner == self.name and self.dog is not None:
             try:
@@ -364,11 +388,12 @@ class SensorModule(Module):
         self._context.set(
             "sensor_history", self.service.history() if self.service else []
         )
+        now = time.time()
         self._context.set(
             "sensor_health",
             {
                 "timestamp": reading.timestamp,
-                "age_s": max(0.0, time.time() - _safe_float(reading.timestamp, time.time())),
+                "age_s": max(0.0, now - _safe_float(reading.timestamp, now)),
                 "distance_valid": reading.distance_valid,
                 "touch_valid": reading.touch_valid,
                 "sound_valid": reading.sound_valid,
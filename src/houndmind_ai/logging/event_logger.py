@@ -3,24 +3,62 @@ from __future__ import annotations
 import json
 import logging
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from houndmind_ai.core.module import Module
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # Optional speedup; stdlib json is the fallback.
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 SCHEMA_VERSION = 1
 
+# Event flags tallied for the summary report.
+_FLAG_KEYS = ("stuck_recovery", "safety_action", "watchdog_action", "mapping_hint")
+
+
+def _encode_line(event: dict[str, Any]) -> bytes:
+    """Encode one JSONL record, using orjson when it is installed.
+
+    Types orjson rejects fall back to stdlib json, so a record encodes
+    whenever json.dumps would; orjson writes NaN and infinities as null.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                event,
+                option=orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_APPEND_NEWLINE
+                | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except TypeError:
+            pass
+    return (json.dumps(event) + "\n").encode("utf-8")
+
 
 class EventLoggerModule(Module):
     """Lightweight event logger with in-memory ring buffer and optional JSONL file."""
 
     def __init__(self, name: str, enabled: bool = True, required: bool = False) -> None:
         super().__init__(name, enabled=enabled, required=required)
-        self._events: list[dict[str, Any]] = []
+        self._events: deque[dict[str, Any]] = deque()
+        # Running tallies over the retained events, kept in step with the ring
+        # buffer so the report never rescans it.
+        self._flag_counts: dict[str, int] = dict.fromkeys(_FLAG_KEYS, 0)
+        self._nav_action_counts: dict[str, int] = {}
         self._last_snapshot: dict[str, Any] = {}
         self._last_log_ts = 0.0
+        # JSONL file kept open for the session (and the raw path setting it
+        # came from), so each record is one write instead of open/write/close.
+        self._log_handle: BinaryIO | None = None
+        self._log_path_src: str | None = None
+        # Records written since the last flush (see event_log_flush_every).
+        self._unflushed = 0
 
     def tick(self, context) -> None:
         settings = (context.get("settings") or {}).get("logging", {})
@@ -75,59 +113,86 @@ class EventLoggerModule(Module):
         context.set("event_log_report", report)
         if settings.get("event_log_file_enabled", True):
             self._write_jsonl({"type": "summary", **report}, settings)
+        self._close_log()
 
     def _append_event(self, event: dict[str, Any], settings: dict[str, Any]) -> None:
         max_entries = int(settings.get("event_log_max_entries", 1000))
         self._events.append(event)
-        if len(self._events) > max_entries:
-            self._events = self._events[-max_entries:]
+        self._count_event(event, 1)
+        while len(self._events) > max(max_entries, 0):
+            self._count_event(self._events.popleft(), -1)
         if settings.get("event_log_file_enabled", True):
             self._write_jsonl(event, settings)
 
     def _write_jsonl(self, event: dict[str, Any], settings: dict[str, Any]) -> None:
         try:
-            path = Path(
-                str(settings.get("event_log_path", "logs/houndmind_events.jsonl"))
-            )
+            handle = self._open_log(settings)
+            handle.write(_encode_line(event))
+            self._unflushed += 1
+            # Snapshots sit in the file buffer and go out as one write per
+            # batch; closing the log (stop, path change) flushes the rest.
+            flush_every = int(settings.get("event_log_flush_every", 10))
+            if self._unflushed >= flush_every:
+                handle.flush()
+                self._unflushed = 0
+        except Exception as exc:  # noqa: BLE001
+            # Reopen next time in case the file or directory was removed.
+            self._close_log()
+            logger.warning("Failed to write event log: %s", exc)
+
+    def _open_log(self, settings: dict[str, Any]) -> BinaryIO:
+        raw = str(settings.get("event_log_path", "logs/houndmind_events.jsonl"))
+        if self._log_handle is None or raw != self._log_path_src:
+            self._close_log()
+            path = Path(raw)
             if not path.is_absolute():
                 path = Path(__file__).resolve().parents[3] / path
             path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open("a", encoding="utf-8") as handle:
-                handle.write(json.dumps(event) + "\n")
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to write event log: %s", exc)
+            self._log_handle = path.open("ab")
+            self._log_path_src = raw
+        return self._log_handle
+
+    def _close_log(self) -> None:
+        if self._log_handle is None:
+            return
+        try:
+            self._log_handle.close()
+        except OSError:
+            pass
+        self._log_handle = None
+        self._unflushed = 0
+
+    def _count_event(self, event: dict[str, Any], delta: int) -> None:
+        # Apply one event to the running tallies (+1 on append, -1 on evict).
+        counts = self._flag_counts
+        for key in _FLAG_KEYS:
+            if event.get(key):
+                counts[key] += delta
+        value = event.get("navigation_action")
+        if not value:
+            return
+        name = str(value)
+        remaining = self._nav_action_counts.get(name, 0) + delta
+        if remaining > 0:
+            self._nav_action_counts[name] = remaining
+        else:
+            self._nav_action_counts.pop(name, None)
 
     def _generate_report(self) -> dict[str, Any]:
-        total = len(self._events)
-        stuck_events = sum(1 for e in self._events if e.get("stuck_recovery"))
-        safety_events = sum(1 for e in self._events if e.get("safety_action"))
-        watchdog_events = sum(1 for e in self._events if e.get("watchdog_action"))
-        # Aggregate navigation actions for quick tuning insight.
-        nav_action_counts = self._count_actions("navigation_action")
-        # Count mapping hint usage (only when present).
-        mapping_hint_events = sum(1 for e in self._events if e.get("mapping_hint"))
+        counts = self._flag_counts
         return {
             "schema_version": SCHEMA_VERSION,
             "timestamp": time.time(),
-            "total_events": total,
-            "stuck_events": stuck_events,
-            "safety_events": safety_events,
-            "watchdog_events": watchdog_events,
-            "mapping_hint_events": mapping_hint_events,
-            "navigation_action_counts": nav_action_counts,
+            "total_events": len(self._events),
+            "stuck_events": counts["stuck_recovery"],
+            "safety_events": counts["safety_action"],
+            "watchdog_events": counts["watchdog_action"],
+            # Count mapping hint usage (only when present).
+            "mapping_hint_events": counts["mapping_hint"],
+            # Aggregate navigation actions for quick tuning insight.
+            "navigation_action_counts": dict(self._nav_action_counts),
         }
 
-    def _count_actions(self, key: str) -> dict[str, int]:
-        # Count distinct action strings found under the provided key.
-        counts: dict[str, int] = {}
-        for event in self._events:
-            value = event.get(key)
-            if not value:
-                continue
-            name = str(value)
-            counts[name] = counts.get(name, 0) + 1
-        return counts
-
     @staticmethod
     def _summarize_module_statuses(statuses: Any) -> dict[str, Any] | None:
         if not isinstance(statuses, dict):
@@ -7,6 +7,14 @@ from houndmind_ai.core.module import Module
 
 logger = logging.getLogger(__name__)
 
+# Navigation mode -> (color key, default color, LED mode key, default LED mode).
+_NAV_LED_STYLES: dict[str, tuple[str, str, str, str]] = {
+    "patrol": ("led_patrol_color", "green", "nav_mode", "breath"),
+    "turn": ("led_turn_color", "orange", "nav_turn_mode", "listen"),
+    "obstacle": ("led_obstacle_color", "red", "nav_obstacle_mode", "bark"),
+    "retreat": ("led_retreat_color", "red", "nav_retreat_mode", "boom"),
+}
+
 
 class LedManagerModule(Module):
     """Centralized RGB LED manager with priority selection."""
@@ -37,14 +45,15 @@ class LedManagerModule(Module):
 
         mode = str(request.get("mode", "patrol"))
         source = str(request.get("source", ""))
-        if (source, mode) == self._last_state and time.time() - self._last_ts < float(
+        now = time.time()
+        if (source, mode) == self._last_state and now - self._last_ts < float(
             settings.get("cooldown_s", 0.5)
         ):
             return
 
         self._apply_led(context, source, mode)
         self._last_state = (source, mode)
-        self._last_ts = time.time()
+        self._last_ts = now
 
     def _select_request(self, context, priority: list[str]) -> dict | None:
         best: dict | None = None
@@ -78,21 +87,13 @@ class LedManagerModule(Module):
             )
             mode_name = settings.get("emotion_mode", "breath")
         else:
-            # navigation modes
-            if mode == "patrol":
-                color = nav.get("led_patrol_color", "green")
+            style = _NAV_LED_STYLES.get(mode)
+            if style is None:
                 mode_name = settings.get("nav_mode", "breath")
-            elif mode == "turn":
-                color = nav.get("led_turn_color", "orange")
-                mode_name = settings.get("nav_turn_mode", "listen")
-            elif mode == "obstacle":
-                color = nav.get("led_obstacle_color", "red")
-                mode_name = settings.get("nav_obstacle_mode", "bark")
-            elif mode == "retreat":
-                color = nav.get("led_retreat_color", "red")
-                mode_name = settings.get("nav_retreat_mode", "boom")
             else:
-                mode_name = settings.get("nav_mode", "breath")
+                color_key, color_default, mode_key, mode_default = style
+                color = nav.get(color_key, color_default)
+                mode_name = settings.get(mode_key, mode_default)
 
         try:
             dog.rgb_strip.set_mode(
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import functools
 from pathlib import Path
 import logging
+import socket
 
 from houndmind_ai.core.config import load_config
 from houndmind_ai.core.logging_setup import setup_logging
-import socket
 from houndmind_ai.core.runtime import HoundMindRuntime
 from houndmind_ai.hal.motors import MotorModule
 from houndmind_ai.hal.sensors import SensorModule
@@ -40,42 +42,57 @@ from houndmind_ai.mapping import default_path_planning_hook
 logger = logging.getLogger(__name__)
 
 
+# (module class, runtime name, modules.* config key) in start/tick order.
+_MODULE_SPECS: tuple[tuple[type, str, str], ...] = (
+    (SensorModule, "hal_sensors", "hal_sensors"),
+    (MotorModule, "hal_motors", "hal_motors"),
+    (PerceptionModule, "perception", "perception"),
+    (ScanningModule, "scanning", "scanning"),
+    (OrientationModule, "orientation", "orientation"),
+    (CalibrationModule, "calibration", "calibration"),
+    (MappingModule, "mapping", "mapping"),
+    (LocalPlannerModule, "local_planner", "navigation"),
+    (ObstacleAvoidanceModule, "navigation", "navigation"),
+    (BehaviorModule, "behavior", "behavior"),
+    (HabituationModule, "habituation", "habituation"),
+    (AttentionModule, "attention", "attention"),
+    (EventLoggerModule, "event_log", "event_log"),
+    (LedManagerModule, "led_manager", "led_manager"),
+    (HealthMonitorModule, "health", "health"),
+    (ServiceWatchdogModule, "service_watchdog", "service_watchdog"),
+    (WatchdogModule, "watchdog", "watchdog"),
+    (BalanceModule, "balance", "balance"),
+    (SafetyModule, "safety", "safety"),
+    (EnergyEmotionModule, "energy_emotion", "energy_emotion"),
+    (VisionModule, "vision", "vision"),
+    (VisionPi4Module, "vision_pi4", "vision_pi4"),
+    (VoiceModule, "voice", "voice"),
+    (FaceRecognitionModule, "face_recognition", "face_recognition"),
+    (SemanticLabelerModule, "semantic_labeler", "semantic_labeler"),
+    (SlamPi4Module, "slam_pi4", "slam_pi4"),
+    (TelemetryDashboardModule, "telemetry_dashboard", "telemetry_dashboard"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _hostname() -> str:
+    # Invariant for the process; resolved once even when main() is re-entered.
+    return socket.gethostname()
+
+
 def build_modules(config) -> list:
     module_configs = config.modules or {}
-    # module_configs may be a dict (from JSON) or an object; normalize to dicts
+    # module_configs may be a dict (from JSON) or a ModuleConfig; normalize to
+    # dicts. ModuleConfig is slotted, so read its fields rather than __dict__.
     def cfg(name: str) -> dict:
         val = module_configs.get(name, {})
-        return val if isinstance(val, dict) else getattr(val, "__dict__", {})
-
-    return [
-        SensorModule("hal_sensors", **cfg("hal_sensors")),
-        MotorModule("hal_motors", **cfg("hal_motors")),
-        PerceptionModule("perception", **cfg("perception")),
-        ScanningModule("scanning", **cfg("scanning")),
-        OrientationModule("orientation", **cfg("orientation")),
-        CalibrationModule("calibration", **cfg("calibration")),
-        MappingModule("mapping", **cfg("mapping")),
-        LocalPlannerModule("local_planner", **cfg("navigation")),
-        ObstacleAvoidanceModule("navigation", **cfg("navigation")),
-        BehaviorModule("behavior", **cfg("behavior")),
-        HabituationModule("habituation", **cfg("habituation")),
-        AttentionModule("attention", **cfg("attention")),
-        EventLoggerModule("event_log", **cfg("event_log")),
-        LedManagerModule("led_manager", **cfg("led_manager")),
-        HealthMonitorModule("health", **cfg("health")),
-        ServiceWatchdogModule("service_watchdog", **cfg("service_watchdog")),
-        WatchdogModule("watchdog", **cfg("watchdog")),
-        BalanceModule("balance", **cfg("balance")),
-        SafetyModule("safety", **cfg("safety")),
-        EnergyEmotionModule("energy_emotion", **cfg("energy_emotion")),
-        VisionModule("vision", **cfg("vision")),
-        VisionPi4Module("vision_pi4", **cfg("vision_pi4")),
-        VoiceModule("voice", **cfg("voice")),
-        FaceRecognitionModule("face_recognition", **cfg("face_recognition")),
-        SemanticLabelerModule("semantic_labeler", **cfg("semantic_labeler")),
-        SlamPi4Module("slam_pi4", **cfg("slam_pi4")),
-        TelemetryDashboardModule("telemetry_dashboard", **cfg("telemetry_dashboard")),
-    ]
+        if isinstance(val, dict):
+            return val
+        if dataclasses.is_dataclass(val) and not isinstance(val, type):
+            return dataclasses.asdict(val)
+        return getattr(val, "__dict__", {})
+
+    return [cls(name, **cfg(key)) for cls, name, key in _MODULE_SPECS]
 
 
 def main() -> None:
@@ -98,10 +115,10 @@ def main() -> None:
         device = (config.settings or {}).get("device", {})
         device_id = device.get("device_id") if isinstance(device, dict) else None
         if not device_id:
-            device_id = socket.gethostname()
+            device_id = _hostname()
     except Exception:
         logger.exception("Failed to determine device id; using hostname fallback")
-        device_id = socket.gethostname()
+        device_id = _hostname()
 
     # Attach the runtime's mutable dict so updates are reflected in logs.
     runtime.context.set("device_id", device_id)
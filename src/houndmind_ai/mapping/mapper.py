@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import math
+import os
 import time
 from pathlib import Path
 
@@ -21,6 +22,8 @@ class MappingModule(Module):
     def __init__(self, name: str, enabled: bool = True, required: bool = False) -> None:
         super().__init__(name, enabled=enabled, required=required)
         self.last_save_ts = 0.0
+        # (path, sample count, newest sample ts) of the last home map written.
+        self._last_saved_marker: tuple | None = None
 
     def tick(self, context) -> None:
         settings = (context.get("settings") or {}).get("mapping", {})
@@ -39,8 +42,9 @@ class MappingModule(Module):
             scan_angles, settings
         )
 
+        now = time.time()
         sample = {
-            "timestamp": time.time(),
+            "timestamp": now,
             "distance_cm": sensors.get("distance"),
             "touch": sensors.get("touch"),
             "sound": sensors.get("sound_detected"),
@@ -56,7 +60,7 @@ class MappingModule(Module):
             mapping_state["samples"] = mapping_state["samples"][-max_samples:]
         max_age_s = float(settings.get("sample_max_age_s", 0))
         if max_age_s > 0:
-            cutoff = time.time() - max_age_s
+            cutoff = now - max_age_s
             mapping_state["samples"] = [
                 entry
                 for entry in mapping_state["samples"]
@@ -113,17 +117,29 @@ class MappingModule(Module):
         samples = list(mapping_state.get("samples", []))
         max_samples = int(settings.get("home_map_max_samples", 0))
         max_age_s = float(settings.get("home_map_max_age_s", 0))
+        now = time.time()
         if max_age_s > 0:
-            cutoff = time.time() - max_age_s
+            cutoff = now - max_age_s
             samples = [
                 entry for entry in samples if entry.get("timestamp", 0) >= cutoff
             ]
         if max_samples > 0 and len(samples) > max_samples:
             samples = samples[-max_samples:]
 
+        # Samples are append-only and timestamped, so an unchanged count and
+        # newest timestamp mean the file on disk already holds this map (for
+        # example a stop() right after a periodic save); skip the rewrite.
+        marker = (
+            str(output_path),
+            len(samples),
+            samples[-1].get("timestamp") if samples else None,
+        )
+        if marker == self._last_saved_marker and output_path.exists():
+            return
+
         payload = {
             "meta": {
-                "saved_at": time.time(),
+                "saved_at": now,
                 "cell_size_cm": settings.get("cell_size_cm", 10),
                 "grid_size": settings.get("grid_size", [100, 100]),
                 "opening_min_width_cm": settings.get("opening_min_width_cm", 60),
@@ -139,7 +155,13 @@ class MappingModule(Module):
             },
             "samples": samples,
         }
-        output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Write a sibling temp file and rename it over the map, so a kill during
+        # the periodic or shutdown save never leaves a truncated home map.
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as fh:
+            fh.write(json.dumps(payload, indent=2))
+        os.replace(tmp_path, output_path)
+        self._last_saved_marker = marker
         logger.info("Saved home map to %s", output_path)
 
     def stop(self, context) -> None:
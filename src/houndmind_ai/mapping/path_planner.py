@@ -10,23 +10,61 @@ def astar(grid, start, goal, passable=lambda v: v == 0):
     passable: function to check if a cell is traversable
     Returns: list of (x, y) from start to goal, or [] if no path
     """
+    if hasattr(grid, "tolist"):
+        # NumPy grid: one C-level conversion beats per-cell ndarray indexing,
+        # which builds a row view and a boxed scalar on every probe.
+        grid = grid.tolist()
     w, h = len(grid[0]), len(grid)
-    open_set = [(0 + abs(goal[0]-start[0]) + abs(goal[1]-start[1]), 0, start, [start])]
-    closed = set()
+    sx, sy = start
+    gx, gy = goal
+    if not (0 <= sx < w and 0 <= sy < h and 0 <= gx < w and 0 <= gy < h):
+        return []
+    # Flat per-cell state indexed by y * w + x; n is above any path cost.
+    n = w * h
+    best_cost = [n] * n
+    parent = [-1] * n
+    closed = bytearray(n)
+    start_idx, goal_idx = sy * w + sx, gy * w + gx
+    best_cost[start_idx] = 0
+    # Heap keys pack (f, n - g, idx) into one int, so heapq compares plain ints
+    # instead of tuples. Among equal f, the deepest node comes first so the
+    # search runs straight at the goal instead of flooding the f-tie band.
+    bits = n.bit_length()
+    mask = (1 << bits) - 1
+    open_set = [((abs(gx - sx) + abs(gy - sy)) << (2 * bits)) | (n << bits) | start_idx]
     while open_set:
-        est, cost, node, path = heapq.heappop(open_set)
-        if node == goal:
-            return path
-        if node in closed:
-            continue
-        closed.add(node)
-        x, y = node
-        for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-            nx, ny = x+dx, y+dy
-            if 0 <= nx < w and 0 <= ny < h and passable(grid[ny][nx]) and (nx,ny) not in closed:
-                heapq.heappush(open_set, (cost+1+abs(goal[0]-nx)+abs(goal[1]-ny), cost+1, (nx,ny), path+[(nx,ny)]))
+        idx = heapq.heappop(open_set) & mask
+        if idx == goal_idx:
+            return _reconstruct_path(parent, idx, w)
+        if closed[idx]:
+            continue  # Stale entry for a node already expanded more cheaply.
+        closed[idx] = 1
+        y, x = divmod(idx, w)
+        new_cost = best_cost[idx] + 1
+        for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if not (0 <= nx < w and 0 <= ny < h):
+                continue
+            nidx = ny * w + nx
+            if closed[nidx] or new_cost >= best_cost[nidx]:
+                continue
+            if not passable(grid[ny][nx]):
+                closed[nidx] = 1  # Blocked: never test this cell again.
+                continue
+            best_cost[nidx] = new_cost
+            parent[nidx] = idx
+            f = new_cost + abs(gx - nx) + abs(gy - ny)
+            heapq.heappush(open_set, (f << (2 * bits)) | ((n - new_cost) << bits) | nidx)
     return []
 
+def _reconstruct_path(parent, idx, w):
+    path = []
+    while idx != -1:
+        y, x = divmod(idx, w)
+        path.append((x, y))
+        idx = parent[idx]
+    path.reverse()
+    return path
+
 def default_path_planning_hook(mapping_state, sample, settings):
     """
     Example hook: plan from current to goal using A* on a grid map.
@@ -37,7 +75,8 @@ def default_path_planning_hook(mapping_state, sample, settings):
     grid = mapping_state.get('grid_map')
     start = mapping_state.get('current_cell')
     goal = settings.get('goal')
-    if not (grid and start and goal):
+    # len() rather than truthiness so NumPy grids work too.
+    if grid is None or not len(grid) or not (start and goal):
         return {'path': [], 'success': False}
     path = astar(grid, start, goal)
     return {'path': path, 'success': bool(path)}
@@ -10,6 +10,14 @@ from houndmind_ai.core.module import Module
 
 logger = logging.getLogger(__name__)
 
+# Dead-end cache sign per turn direction, and the opposite turn for no-go flips.
+_DEAD_END_SIGN = {"left": -1, "right": 1}
+_OPPOSITE_TURN = {"left": "right", "right": "left"}
+# Parsed position for an unparsable grid key; iy < 0 keeps it out of every count.
+_INVALID_GRID_CELL = (0, -1)
+# Upper bound on remembered grid keys (the mapper caps the grid at grid_size).
+_GRID_KEY_CACHE_MAX = 65536
+
 
 def _safe_float(val: Any, default: float) -> float:
     try:
@@ -42,7 +50,12 @@ class ObstacleAvoidanceModule(Module):
         self._last_scan_ts = 0.0
         self._last_approach_ts = 0.0
         self._approach_votes: deque[bool] = deque(maxlen=1)
-        self._movement_history: deque[tuple[float, float]] = deque(maxlen=100)
+        # Stuck detection window kept as parallel timestamp/magnitude deques
+        # with a running sum, so the per-tick average is O(1).
+        self._movement_ts: deque[float] = deque()
+        self._movement_mag: deque[float] = deque()
+        self._movement_sum = 0.0
+        self._movement_max_samples = 100
         self._last_stuck_ts = 0.0
         self._avoid_history: deque[float] = deque(maxlen=20)
         self._strategy_index = 0
@@ -54,13 +67,27 @@ class ObstacleAvoidanceModule(Module):
         self._decision_last_ts = 0.0
         self._turn_cooldown_ts = 0.0
         self._dead_end_cache: deque[int] = deque(maxlen=5)
+        # Running left/right tallies for _dead_end_cache, kept in sync on push.
+        self._dead_end_left = 0
+        self._dead_end_right = 0
         self._clear_path_streak = 0
         self._no_go_history: deque[tuple[float, str]] = deque(maxlen=40)
         # Gentle recovery state
         self._gentle_recovery_active = False
         self._gentle_recovery_until = 0.0
+        # Log events raised during one tick, keyed by kind so repeats overwrite;
+        # flushed as a single record when the tick ends.
+        self._tick_log: dict[str, tuple[str, tuple[Any, ...]]] = {}
+        # "ix,iy" occupancy grid keys -> (ix, iy), parsed once per key.
+        self._grid_key_cache: dict[str, tuple[int, int]] = {}
 
     def tick(self, context) -> None:
+        try:
+            self._tick(context)
+        finally:
+            self._flush_tick_log()
+
+    def _tick(self, context) -> None:
         perception = context.get("perception") or {}
         obstacle = perception.get("obstacle", False)
         sensor_reading = context.get("sensor_reading")
@@ -132,11 +159,9 @@ class ObstacleAvoidanceModule(Module):
                         nav_action = safe_action
                 else:
                     direction, score, confirmed = scan_result
-                    logger.info(
-                        "Navigation scan: dir=%s score=%.1f confirmed=%s",
-                        direction,
-                        score,
-                        confirmed,
+                    self._tick_log["scan"] = (
+                        "scan dir=%s score=%.1f confirmed=%s",
+                        (direction, score, confirmed),
                     )
                     low_confidence_cooldown = _safe_float(
                         settings.get("low_confidence_cooldown_s", 0.8), 0.8
@@ -280,8 +305,9 @@ class ObstacleAvoidanceModule(Module):
         if isinstance(distance, (int, float)) and 0 < distance <= emergency_stop_cm:
             context.set("navigation_action", avoid_action)
             self._record_no_go("forward", now)
-            logger.info(
-                "Navigation emergency retreat: %s (distance=%s)", avoid_action, distance
+            self._tick_log["emergency"] = (
+                "emergency retreat %s (distance=%s)",
+                (avoid_action, distance),
             )
             return
 
@@ -311,11 +337,9 @@ class ObstacleAvoidanceModule(Module):
             return
 
         direction, score, confirmed = scan_result
-        logger.info(
-            "Navigation scan: dir=%s score=%.1f confirmed=%s",
-            direction,
-            score,
-            confirmed,
+        self._tick_log["scan"] = (
+            "scan dir=%s score=%.1f confirmed=%s",
+            (direction, score, confirmed),
         )
 
         low_confidence_cooldown = _safe_float(
@@ -473,6 +497,9 @@ class ObstacleAvoidanceModule(Module):
             except Exception:
                 latest = None
             if latest is None:
+                # Nothing usable yet: have the background loop scan now rather
+                # than waiting out its interval.
+                scan_service.request_scan()
                 return None
             reading = latest
             context.set("scan_reading", reading)
@@ -565,18 +592,31 @@ class ObstacleAvoidanceModule(Module):
 
     def _record_turn(self, direction: str) -> None:
         self._clear_path_streak = 0
-        if direction == "left":
-            self._dead_end_cache.append(-1)
-        elif direction == "right":
-            self._dead_end_cache.append(1)
+        sign = _DEAD_END_SIGN.get(direction)
+        if sign is not None:
+            self._push_dead_end(sign)
         self._turn_cooldown_ts = time.time()
 
+    def _push_dead_end(self, sign: int) -> None:
+        cache = self._dead_end_cache
+        if cache.maxlen is not None and len(cache) == cache.maxlen:
+            # The oldest entry is about to be evicted; drop it from the tally.
+            if cache[0] < 0:
+                self._dead_end_left -= 1
+            else:
+                self._dead_end_right -= 1
+        cache.append(sign)
+        if sign < 0:
+            self._dead_end_left += 1
+        else:
+            self._dead_end_right += 1
+
     def _is_dead_end(self, direction: str) -> bool:
         maxlen = self._dead_end_cache.maxlen
         if maxlen is None or len(self._dead_end_cache) < maxlen:
             return False
-        neg = sum(1 for v in self._dead_end_cache if v < 0)
-        pos = sum(1 for v in self._dead_end_cache if v > 0)
+        neg = self._dead_end_left
+        pos = self._dead_end_right
         if direction == "left" and neg > pos:
             return True
         if direction == "right" and pos > neg:
@@ -645,14 +685,20 @@ class ObstacleAvoidanceModule(Module):
 
         left_count = 0
         right_count = 0
+        key_cache = self._grid_key_cache
+        if len(key_cache) > _GRID_KEY_CACHE_MAX:
+            key_cache.clear()
         # cells keys are "ix,iy" where ix = lateral (left + / right -), iy = forward cells
         for k, v in cells.items():
-            try:
-                ix_s, iy_s = k.split(",")
-                ix = int(ix_s)
-                iy = int(iy_s)
-            except Exception:
-                continue
+            pos = key_cache.get(k)
+            if pos is None:
+                try:
+                    ix_s, iy_s = k.split(",")
+                    pos = (int(ix_s), int(iy_s))
+                except Exception:
+                    pos = _INVALID_GRID_CELL
+                key_cache[k] = pos
+            ix, iy = pos
             if iy < 0 or iy > depth_cells:
                 continue
             if ix < 0:
@@ -694,9 +740,8 @@ class ObstacleAvoidanceModule(Module):
             return fallback
         return direction
 
-    @staticmethod
     def _emit_mapping_hint(
-        context, fallback: str, chosen: str, best_path: dict
+        self, context, fallback: str, chosen: str, best_path: dict
     ) -> None:
         if fallback == chosen:
             return
@@ -709,7 +754,20 @@ class ObstacleAvoidanceModule(Module):
                 "best_path": best_path,
             },
         )
-        logger.info("Mapping hint influenced turn: %s -> %s", fallback, chosen)
+        self._tick_log["mapping_hint"] = (
+            "mapping hint %s -> %s",
+            (fallback, chosen),
+        )
+
+    def _flush_tick_log(self) -> None:
+        events = self._tick_log
+        if not events:
+            return
+        if logger.isEnabledFor(logging.INFO):
+            fmt = "; ".join(entry[0] for entry in events.values())
+            args = tuple(arg for entry in events.values() for arg in entry[1])
+            logger.info("Navigation tick: " + fmt, *args)
+        events.clear()
 
     def _record_avoidance(self, now: float) -> None:
         self._avoid_history.append(now)
@@ -731,10 +789,7 @@ class ObstacleAvoidanceModule(Module):
         recent = [d for ts, d in self._no_go_history if now - ts <= window_s]
         count = sum(1 for d in recent if d == direction)
         if count >= repeat:
-            if direction == "left":
-                return "right"
-            if direction == "right":
-                return "left"
+            return _OPPOSITE_TURN.get(direction, direction)
         return direction
 
     def _check_stuck(self, context, settings, now: float) -> bool:
@@ -747,20 +802,29 @@ class ObstacleAvoidanceModule(Module):
             + abs(_safe_float(acc[1], 0.0))
             + abs(_safe_float(acc[2], 0.0))
         )
-        self._movement_history.append((now, magnitude))
+        ts_window = self._movement_ts
+        mag_window = self._movement_mag
+        ts_window.append(now)
+        mag_window.append(magnitude)
+        self._movement_sum += magnitude
+        if len(mag_window) > self._movement_max_samples:
+            ts_window.popleft()
+            self._movement_sum -= mag_window.popleft()
 
         window_s = float(settings.get("stuck_time_window_s", 5.0))
         threshold = float(settings.get("stuck_movement_threshold", 1500.0))
         min_samples = int(settings.get("stuck_min_samples", 10))
         cooldown = float(settings.get("stuck_cooldown_s", 6.0))
 
-        while self._movement_history and now - self._movement_history[0][0] > window_s:
-            self._movement_history.popleft()
-        if len(self._movement_history) < min_samples:
+        while ts_window and now - ts_window[0] > window_s:
+            ts_window.popleft()
+            self._movement_sum -= mag_window.popleft()
+        if not mag_window:
+            # Reset to shed any accumulated floating-point drift.
+            self._movement_sum = 0.0
+        if len(mag_window) < min_samples:
             return False
-        avg = sum(val for _, val in self._movement_history) / len(
-            self._movement_history
-        )
+        avg = self._movement_sum / len(mag_window)
         if avg >= threshold:
             return False
         if now - self._last_stuck_ts < cooldown:
@@ -36,6 +36,8 @@ class OrientationModule(Module):
         self._heading_deg = 0.0
         self._context = None
         self._sensor_service = None
+        # Service drained once per tick when batch_updates is enabled.
+        self._batch_service = None
 
     def start(self, context) -> None:
         self._context = context
@@ -44,13 +46,18 @@ class OrientationModule(Module):
         self._heading_deg = initial % 360.0
         context.set("current_heading", self._heading_deg)
         service = context.get("sensor_service")
-        if service is not None and hasattr(service, "subscribe"):
+        if settings.get("batch_updates", False) and hasattr(service, "history"):
+            self._batch_service = service
+        elif service is not None and hasattr(service, "subscribe"):
             self._sensor_service = service
             service.subscribe(self._on_sensor_reading)
         if settings.get("calibration_enabled", True):
             self._calibrate_bias(context, settings)
 
     def tick(self, context) -> None:
+        if self._batch_service is not None:
+            self._update_from_history(context, self._batch_service.history())
+            return
         reading = context.get("sensor_reading")
         if reading is not None:
             self._update_from_reading(context, reading)
@@ -62,6 +69,7 @@ class OrientationModule(Module):
             except Exception:  # noqa: BLE001
                 pass
         self._sensor_service = None
+        self._batch_service = None
         self._last_ts = None
 
     def _on_sensor_reading(self, reading) -> None:
@@ -71,9 +79,10 @@ class OrientationModule(Module):
 
     def _update_from_reading(self, context, reading) -> None:
         gyro = getattr(reading, "gyro", None)
-        ts = _safe_float(getattr(reading, "timestamp", time.time()), time.time())
         if gyro is None:
             return
+        now = time.time()
+        ts = _safe_float(getattr(reading, "timestamp", now), now)
         gz = _safe_float(gyro[2] if len(gyro) > 2 else None, 0.0)
 
         settings = (context.get("settings") or {}).get("orientation", {})
@@ -90,6 +99,29 @@ class OrientationModule(Module):
         self._heading_deg = (self._heading_deg + gz_corrected * dt) % 360.0
         context.set("current_heading", self._heading_deg)
 
+    def _update_from_history(self, context, readings) -> None:
+        """Integrate every buffered reading newer than the last one processed."""
+        settings = (context.get("settings") or {}).get("orientation", {})
+        scale = _safe_float(settings.get("gyro_scale", 1.0), 1.0)
+        bias = _safe_float(context.get("orientation_bias_z") or settings.get("bias_z", 0.0), 0.0)
+        heading = self._heading_deg
+        last_ts = self._last_ts
+        for reading in readings:
+            gyro = getattr(reading, "gyro", None)
+            if gyro is None or len(gyro) < 3:
+                continue
+            ts = _safe_float(getattr(reading, "timestamp", None), 0.0)
+            if last_ts is None:
+                last_ts = ts
+                continue
+            if ts <= last_ts:
+                continue
+            heading += (_safe_float(gyro[2], 0.0) - bias) * scale * (ts - last_ts)
+            last_ts = ts
+        self._last_ts = last_ts
+        self._heading_deg = heading % 360.0
+        context.set("current_heading", self._heading_deg)
+
     def _calibrate_bias(self, context, settings: dict[str, object]) -> None:
         settle_s = _safe_float(settings.get("calibration_settle_s", 0.0), 0.0)
         duration_s = _safe_float(settings.get("calibration_duration_s", 2.0), 2.0)
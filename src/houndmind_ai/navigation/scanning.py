@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 import logging
 import threading
@@ -29,7 +30,7 @@ def _safe_int(val: Any, default: int) -> int:
         return default
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanReading:
     mode: str
     data: dict[int, float] | dict[str, float]
@@ -53,20 +54,29 @@ class ScanningService:
         self._settings = settings
         self._thread: threading.Thread | None = None
         self._stop = threading.Event()
+        # Wakes the background loop between scheduled scans (request_scan/stop).
+        self._wake = threading.Event()
         self._callbacks: list[Callable[[ScanReading], None]] = []
         self._latest: ScanReading | None = None
         self._history: list[ScanReading] = []
         self._interval_override: float | None = None
+        # Hardware entry points, resolved once instead of probed per sample.
+        self._wait_head_done: Callable[[], Any] | None = getattr(
+            dog, "wait_head_done", None
+        )
+        self._distance_reader: Callable[[], Any] | None = None
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
             return
         self._stop.clear()
+        self._wake.clear()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
     def stop(self, timeout: float = 2.0) -> None:
         self._stop.set()
+        self._wake.set()
         if self._thread:
             self._thread.join(timeout=timeout)
 
@@ -82,6 +92,10 @@ class ScanningService:
     def history(self) -> list[ScanReading]:
         return list(self._history)
 
+    def request_scan(self) -> None:
+        """Ask the background loop to scan now instead of at its next slot."""
+        self._wake.set()
+
     def set_interval_override(self, interval_s: float | None) -> None:
         if interval_s is None:
             self._interval_override = None
@@ -142,38 +156,49 @@ class ScanningService:
         return ScanReading(mode="sweep", data=result, timestamp=time.time())
 
     def _loop(self) -> None:
-        scan_mode = str(self._settings.get("scan_mode", "sweep"))
+        # Scan settings are fixed for the service's lifetime; bind them once.
+        settings = self._settings
+        scan_mode = str(settings.get("scan_mode", "sweep"))
+        angles = self.build_angles() if scan_mode != "three_way" else []
+        max_len = max(1, _safe_int(settings.get("scan_history_size", 10), 10))
+        base_interval = _safe_float(settings.get("scan_interval_s", 0.5), 0.5)
+        min_interval = _safe_float(settings.get("scan_interval_min_s", 0.2), 0.2)
+        max_interval = _safe_float(settings.get("scan_interval_max_s", 2.0), 2.0)
+        safe_mode_interval: float | None = None
+        if settings.get("safe_mode_enabled", False):
+            # Floor only; an unset or invalid value leaves the interval alone.
+            safe_mode_interval = _safe_float(
+                settings.get("safe_mode_scan_interval_s"), 0.0
+            )
+        next_scan = time.monotonic()
         while not self._stop.is_set():
-            start = time.time()
             try:
                 if scan_mode == "three_way":
                     reading = self.scan_three_way()
                 else:
-                    angles = self.build_angles()
                     reading = self.sweep_scan(angles)
                 self._latest = reading
                 self._history.append(reading)
-                max_len = max(1, _safe_int(self._settings.get("scan_history_size", 10), 10))
                 if len(self._history) > max_len:
                     self._history = self._history[-max_len:]
                 for cb in list(self._callbacks):
                     cb(reading)
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Scanning loop failed: %s", exc)
-            elapsed = time.time() - start
-            interval = _safe_float(self._settings.get("scan_interval_s", 0.5), 0.5)
-            min_interval = _safe_float(self._settings.get("scan_interval_min_s", 0.2), 0.2)
-            max_interval = _safe_float(self._settings.get("scan_interval_max_s", 2.0), 2.0)
+            interval = base_interval
             if self._interval_override is not None:
                 interval = self._interval_override
             # Safe-mode override from settings.
-            if self._settings.get("safe_mode_enabled", False):
-                interval = max(
-                    interval,
-                    _safe_float(self._settings.get("safe_mode_scan_interval_s", interval), interval),
-                )
+            if safe_mode_interval is not None:
+                interval = max(interval, safe_mode_interval)
             interval = min(max(interval, min_interval), max_interval)
-            time.sleep(max(0.0, interval - elapsed))
+            # Same fixed-rate monotonic schedule as the sensor poll loop, but
+            # waiting on an event so request_scan() and stop() cut it short.
+            now = time.monotonic()
+            next_scan = max(next_scan + interval, now)
+            if self._wake.wait(next_scan - now):
+                self._wake.clear()
+                next_scan = time.monotonic()
 
     def build_angles(self) -> list[int]:
         yaw_max = _safe_int(self._settings.get("scan_yaw_max_deg", 60), 60)
@@ -185,17 +210,23 @@ class ScanningService:
 
     def _head_move(self, yaw: int, speed: int) -> None:
         self._dog.head_move([[int(yaw), 0, 0]], speed=speed)
-        if hasattr(self._dog, "wait_head_done"):
-            self._dog.wait_head_done()
+        if self._wait_head_done is not None:
+            self._wait_head_done()
         time.sleep(0.05)
 
     def _read_distance(self, samples: int, between_reads_s: float) -> float:
         values: list[float] = []
+        reader = self._distance_reader
+        if reader is None:
+            dog = self._dog
+            reader = (
+                dog.read_distance
+                if hasattr(dog, "read_distance")
+                else dog.ultrasonic.read_distance
+            )
+            self._distance_reader = reader
         for _ in range(max(1, samples)):
-            if hasattr(self._dog, "read_distance"):
-                value = self._dog.read_distance()
-            else:
-                value = self._dog.ultrasonic.read_distance()
+            value = reader()
             try:
                 val = float(value)
             except Exception:
@@ -216,6 +247,9 @@ class ScanningModule(Module):
         self.service: ScanningService | None = None
         self._context = None
         self._last_scan_ts = 0.0
+        # Serialized recent readings, appended once per reading rather than
+        # re-serializing the whole service history on every publish.
+        self._history_dicts: deque[dict[str, object]] = deque(maxlen=10)
 
     def start(self, context) -> None:
         if not self.status.enabled:
@@ -236,6 +270,9 @@ class ScanningModule(Module):
             "safe_mode_scan_interval_s", merged.get("scan_interval_s", 0.5)
         )
         self.service = ScanningService(dog, merged)
+        self._history_dicts = deque(
+            maxlen=max(1, _safe_int(merged.get("scan_history_size", 10), 10))
+        )
         self.service.subscribe(self._publish_reading)
         context.set("scan_service", self.service)
 
@@ -245,9 +282,10 @@ class ScanningModule(Module):
     def tick(self, context) -> None:
         if self.service is None:
             return
+        all_settings = context.get("settings") or {}
         if settings_continuous(context):
             override = context.get("scan_interval_override_s")
-            quiet = (context.get("settings") or {}).get("quiet_mode", {})
+            quiet = all_settings.get("quiet_mode", {})
             if context.get("quiet_mode_active"):
                 quiet_interval = quiet.get("scan_interval_s")
                 try:
@@ -264,17 +302,17 @@ class ScanningModule(Module):
             except Exception:  # noqa: BLE001
                 pass
             return
-        settings = (context.get("settings") or {}).get("navigation", {})
+        settings = all_settings.get("navigation", {})
         interval = float(settings.get("scan_interval_s", 0.5))
         min_interval = float(settings.get("scan_interval_min_s", 0.2))
         max_interval = float(settings.get("scan_interval_max_s", 2.0))
         interval = min(max(interval, min_interval), max_interval)
-        perf = (context.get("settings") or {}).get("performance", {})
+        perf = all_settings.get("performance", {})
         if perf.get("safe_mode_enabled", False):
             interval = max(
                 interval, float(perf.get("safe_mode_scan_interval_s", interval))
             )
-        quiet = (context.get("settings") or {}).get("quiet_mode", {})
+        quiet = all_settings.get("quiet_mode", {})
         if context.get("quiet_mode_active"):
             try:
                 quiet_interval = float(quiet.get("scan_interval_s", interval))
@@ -299,16 +337,17 @@ class ScanningModule(Module):
 
     def stop(self, context) -> None:
         if self.service:
-            self.service.stop()
+            self.service.stop(timeout=self.stop_timeout(context, 2.0, minimum=1.0))
             self.service = None
 
     def _publish_reading(self, reading: ScanReading) -> None:
         if self._context is None:
             return
         self._context.set("scan_reading", reading)
-        self._context.set("scan_latest", reading.to_dict())
-        history = self.service.history() if self.service else []
-        self._context.set("scan_history", [entry.to_dict() for entry in history])
+        latest = reading.to_dict()
+        self._context.set("scan_latest", latest)
+        self._history_dicts.append(latest)
+        self._context.set("scan_history", list(self._history_dicts))
         # Emit scan quality summary for tuning.
         distances = []
         data = reading.data or {}
@@ -2,12 +2,55 @@ from __future__ import annotations
 
 import logging
 import time
+from dataclasses import dataclass
 
+from houndmind_ai.core.config import SettingsCache
 from houndmind_ai.core.module import Module
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _EnergyParams:
+    initial: float
+    decay: float
+    boost_touch: float
+    boost_sound: float
+    boost_obstacle: float
+    min_energy: float
+    max_energy: float
+    speed_fast_threshold: float
+    speed_slow_threshold: float
+
+    @staticmethod
+    def from_settings(settings: dict) -> _EnergyParams:
+        energy_cfg = settings.get("energy", {})
+        return _EnergyParams(
+            initial=float(energy_cfg.get("initial", 0.6)),
+            decay=float(energy_cfg.get("decay_per_tick", 0.01)),
+            boost_touch=float(energy_cfg.get("boost_touch", 0.08)),
+            boost_sound=float(energy_cfg.get("boost_sound", 0.05)),
+            boost_obstacle=float(energy_cfg.get("boost_obstacle", 0.02)),
+            min_energy=float(energy_cfg.get("min", 0.0)),
+            max_energy=float(energy_cfg.get("max", 1.0)),
+            speed_fast_threshold=float(energy_cfg.get("speed_fast_threshold", 0.75)),
+            speed_slow_threshold=float(energy_cfg.get("speed_slow_threshold", 0.35)),
+        )
+
+
+def _step_energy(
+    energy: float, touch: bool, sound: bool, obstacle: bool, params: _EnergyParams
+) -> float:
+    """Apply one tick of stimulus boosts and decay, clamped to the configured range."""
+    if touch:
+        energy += params.boost_touch
+    if sound:
+        energy += params.boost_sound
+    if obstacle:
+        energy += params.boost_obstacle
+    return max(params.min_energy, min(params.max_energy, energy - params.decay))
+
+
 class EnergyEmotionModule(Module):
     """Optional lightweight energy/emotion tracker.
 
@@ -18,44 +61,35 @@ class EnergyEmotionModule(Module):
     def __init__(self, name: str, enabled: bool = True, required: bool = False) -> None:
         super().__init__(name, enabled=enabled, required=required)
         self._last_led_ts = 0.0
+        self._params = SettingsCache(_EnergyParams.from_settings)
 
     def tick(self, context) -> None:
         settings = context.get("settings") or {}
-        energy_cfg = settings.get("energy", {})
         emotion_cfg = settings.get("emotion", {})
 
+        params = self._params.get(settings)
+
         energy = context.get("energy_level")
         try:
-            energy = (
-                float(energy)
-                if energy is not None
-                else float(energy_cfg.get("initial", 0.6))
-            )
+            energy = float(energy) if energy is not None else params.initial
         except Exception:
             energy = 0.6
 
-        decay = float(energy_cfg.get("decay_per_tick", 0.01))
-        boost_touch = float(energy_cfg.get("boost_touch", 0.08))
-        boost_sound = float(energy_cfg.get("boost_sound", 0.05))
-        boost_obstacle = float(energy_cfg.get("boost_obstacle", 0.02))
-        min_energy = float(energy_cfg.get("min", 0.0))
-        max_energy = float(energy_cfg.get("max", 1.0))
-
         perception = context.get("perception") or {}
-        if perception.get("touch") not in (None, "N"):
-            energy += boost_touch
-        if perception.get("sound"):
-            energy += boost_sound
-        if perception.get("obstacle"):
-            energy += boost_obstacle
-        energy = max(min_energy, min(max_energy, energy - decay))
+        energy = _step_energy(
+            energy,
+            perception.get("touch") not in (None, "N"),
+            bool(perception.get("sound")),
+            bool(perception.get("obstacle")),
+            params,
+        )
 
         context.set("energy_level", energy)
 
         # Speed hint for movement subsystems.
-        if energy >= float(energy_cfg.get("speed_fast_threshold", 0.75)):
+        if energy >= params.speed_fast_threshold:
             speed_hint = "fast"
-        elif energy <= float(energy_cfg.get("speed_slow_threshold", 0.35)):
+        elif energy <= params.speed_slow_threshold:
             speed_hint = "slow"
         else:
             speed_hint = "normal"
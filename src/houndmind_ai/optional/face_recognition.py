@@ -4,13 +4,15 @@ import json
 import logging
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs, urlparse
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from houndmind_ai.core.module import Module
 
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
 logger = logging.getLogger(__name__)
 
 
@@ -187,6 +189,8 @@ class FaceRecognitionModule(Module):
         http_settings = settings.get("http", {})
         if not http_settings.get("enabled", False):
             return
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
         host = http_settings.get("host", "0.0.0.0")
         port = int(http_settings.get("port", 8088))
 
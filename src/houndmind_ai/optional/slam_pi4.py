@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import time
 from collections import deque
@@ -124,6 +125,9 @@ class SlamPi4Module(Module):
 
         # Track last map export time
         self._last_map_export_ts = 0.0
+        # Last map/trajectory fetched from the adapter and when (monotonic).
+        self._map_data = None
+        self._map_fetch_ts = float("-inf")
 
     def start(self, context) -> None:
         if not self.status.enabled:
@@ -218,12 +222,21 @@ class SlamPi4Module(Module):
                         self._pose = {"x": x, "y": y, "yaw": yaw, "confidence": conf}
                     except Exception:
                         pass
-                map_data = self._adapter.get_map_data() if self._adapter else None
-                trajectory = self._adapter.get_trajectory() if self._adapter else None
-                context.set("slam_map_data", map_data)
-                context.set("slam_trajectory", trajectory)
+                # Map and trajectory are whole-map snapshots; refresh them at
+                # most every map_refresh_interval_s and keep the last ones.
+                map_interval = _safe_float(
+                    settings.get("map_refresh_interval_s", 1.0), 1.0
+                )
+                fetch_ts = time.monotonic()
+                if fetch_ts - self._map_fetch_ts >= map_interval:
+                    self._map_fetch_ts = fetch_ts
+                    self._map_data = self._adapter.get_map_data()
+                    trajectory = self._adapter.get_trajectory()
+                    context.set("slam_map_data", self._map_data)
+                    context.set("slam_trajectory", trajectory)
             except Exception as exc:
                 logger.warning("RTAB-Map retrieval failed: %s", exc)
+                self._map_data = None
                 context.set("slam_map_data", None)
                 context.set("slam_trajectory", None)
 
@@ -234,12 +247,10 @@ class SlamPi4Module(Module):
             if map_export_interval > 0 and map_export_path:
                 if now - self._last_map_export_ts >= map_export_interval:
                     try:
-                        md = self._adapter.get_map_data() if self._adapter else None
+                        md = self._map_data
                         if md is not None:
                             try:
                                 if map_export_format == "json":
-                                    import json
-
                                     with open(map_export_path, "w", encoding="utf-8") as fh:
                                         fh.write(json.dumps({"exported_at": now, "map": md}))
                                 elif map_export_format == "ply":
@@ -252,14 +263,10 @@ class SlamPi4Module(Module):
                                                 fh.write(f"{p[0]} {p[1]} {p[2]}\n")
                                     except Exception:
                                         logger.debug("Failed to export PLY; falling back to JSON")
-                                        import json
-
                                         with open(map_export_path, "w", encoding="utf-8") as fh:
                                             fh.write(json.dumps({"exported_at": now, "map": md}))
                                 else:
                                     # Unknown format: default to JSON
-                                    import json
-
                                     with open(map_export_path, "w", encoding="utf-8") as fh:
                                         fh.write(json.dumps({"exported_at": now, "map": md}))
                                 self._last_map_export_ts = now
@@ -317,8 +324,6 @@ class SlamPi4Module(Module):
 
     @staticmethod
     def _normalize_angle(angle: float) -> float:
-        while angle <= -180.0:
-            angle += 360.0
-        while angle > 180.0:
-            angle -= 360.0
-        return angle
+        # Wrap to (-180, 180] in one step. The stub pose integrates gyro yaw
+        # without wrapping, so the old +/-360 loops grew with uptime.
+        return 180.0 - (180.0 - angle) % 360.0
@@ -4,14 +4,51 @@ import json
 import logging
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import urlparse, parse_qs
+from typing import TYPE_CHECKING, Any
 
 from houndmind_ai.core.module import Module
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # Optional speedup; stdlib json is the fallback.
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode numpy scalars as plain numbers and anything else as its str()."""
+    item = getattr(obj, "item", None)
+    if callable(item):
+        try:
+            return item()
+        except (TypeError, ValueError):
+            pass
+    return str(obj)
+
+
+def _encode_json(payload: Any) -> bytes:
+    """Encode an HTTP response body, using orjson when it is installed.
+
+    orjson writes NaN and infinities as null (stdlib emits bare NaN, which
+    the dashboard's JSON.parse rejects anyway).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except TypeError:  # e.g. ints beyond 64 bits; let stdlib handle it.
+            pass
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
 class TelemetryDashboardModule(Module):
     """Optional telemetry dashboard (Pi4-focused).
 
@@ -27,12 +64,18 @@ class TelemetryDashboardModule(Module):
         self._snapshot: dict = {}
         self._last_ts = 0.0
         self._last_vision_ts: float | None = None
+        # HTTP options; set from settings when the server starts.
+        self._camera_path = "/camera"
+        self._auth_token: str | None = None
         self._vision_fps: float | None = None
+        # Set by stop() so keep-alive connections still open are turned away.
+        self._stopping = threading.Event()
 
     def start(self, context) -> None:
         if not self.status.enabled:
             return
         self.available = True
+        self._stopping.clear()
         settings = (context.get("settings") or {}).get("telemetry_dashboard", {})
         self._maybe_start_http(settings)
         context.set("telemetry_status", {"status": "ready"})
@@ -146,6 +189,9 @@ class TelemetryDashboardModule(Module):
         self._last_ts = now
 
     def stop(self, context) -> None:
+        # shutdown() only closes the listening socket; handler threads keep
+        # serving their open connections until they see this flag.
+        self._stopping.set()
         if self._http_server is not None:
             try:
                 self._http_server.shutdown()
@@ -157,6 +203,8 @@ class TelemetryDashboardModule(Module):
         http_settings = settings.get("http", {})
         if not http_settings.get("enabled", False):
             return
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
         # Default to loopback for LAN-safe behavior. Allow overriding,
         # but warn if binding to 0.0.0.0 (public) without explicit opt-in.
         host = http_settings.get("host", "127.0.0.1")
@@ -174,19 +222,32 @@ class TelemetryDashboardModule(Module):
         module = self
 
         class Handler(BaseHTTPRequestHandler):
+            # Keep-alive: the dashboard page polls /snapshot, so reuse one
+            # connection instead of a TCP handshake per poll. Every response
+            # sets Content-Length; idle connections close after the timeout.
+            protocol_version = "HTTP/1.1"
+            timeout = 30
+
             def _send_json(self, payload, status=200):
-                data = json.dumps(payload, default=str).encode("utf-8")
+                data = _encode_json(payload)
                 self.send_response(status)
                 self.send_header("Content-Type", "application/json")
                 self.send_header("Content-Length", str(len(data)))
+                if self.close_connection:
+                    self.send_header("Connection", "close")
                 self.end_headers()
                 self.wfile.write(data)
 
             def do_GET(self):
+                if module._stopping.is_set():
+                    self.close_connection = True
+                    self._send_json({"error": "shutting down"}, status=503)
+                    return
+
                 # Simple auth check: allow if no token configured; otherwise
                 # require header `X-Auth-Token` or query `auth_token`.
                 def _auth_ok():
-                    token = getattr(module, "_auth_token", None)
+                    token = module._auth_token
                     if not token:
                         return True
                     # check header first
@@ -230,7 +291,7 @@ class TelemetryDashboardModule(Module):
                         return
                     # Serve as JSON
                     self.send_response(200)
-                    payload = json.dumps({"map": data}, default=str).encode("utf-8")
+                    payload = _encode_json({"map": data})
                     self.send_header("Content-Type", "application/json")
                     self.send_header("Content-Length", str(len(payload)))
                     self.end_headers()
@@ -270,7 +331,7 @@ class TelemetryDashboardModule(Module):
                         self._send_json({"error": "no trajectory"}, status=404)
                         return
                     self.send_response(200)
-                    payload = json.dumps({"trajectory": data}, default=str).encode("utf-8")
+                    payload = _encode_json({"trajectory": data})
                     self.send_header("Content-Type", "application/json")
                     self.send_header("Content-Length", str(len(payload)))
                     self.end_headers()
@@ -282,7 +343,7 @@ class TelemetryDashboardModule(Module):
                 if self.path == "/":
                     # Inject configured camera path into the dashboard HTML
                     html = _DASHBOARD_HTML.replace(
-                        "{{CAMERA_PATH}}", str(getattr(module, "_camera_path", "/camera"))
+                        "{{CAMERA_PATH}}", str(module._camera_path)
                     ).encode("utf-8")
                     self.send_response(200)
                     self.send_header("Content-Type", "text/html")
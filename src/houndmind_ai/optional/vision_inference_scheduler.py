@@ -24,6 +24,8 @@ class VisionInferenceScheduler:
         self.result_queue: queue.Queue[Any] = queue.Queue()
         self._stop_event = threading.Event()
         self._thread = threading.Thread(target=self._run, daemon=True)
+        # Frames evicted unprocessed because inference fell behind.
+        self.dropped_frames = 0
 
     def start(self):
         self._stop_event.clear()
@@ -31,16 +33,32 @@ class VisionInferenceScheduler:
             self._thread = threading.Thread(target=self._run, daemon=True)
             self._thread.start()
 
-    def stop(self):
+    def stop(self, timeout: float = 2.0):
         self._stop_event.set()
-        self._thread.join(timeout=2)
+        self._thread.join(timeout=timeout)
 
     def submit_frame(self, frame: Any):
         try:
             self.frame_queue.put_nowait(frame)
+            return
         except queue.Full:
-            # Drop frame if queue is full (backpressure)
             pass
+        # Backpressure: evict the oldest queued frame so inference always works
+        # on the freshest camera data, and count the loss instead of hiding it.
+        try:
+            self.frame_queue.get_nowait()
+        except queue.Empty:
+            pass  # The worker drained the queue first; nothing was dropped.
+        else:
+            self.dropped_frames += 1
+        try:
+            self.frame_queue.put_nowait(frame)
+        except queue.Full:
+            self.dropped_frames += 1
+
+    def pending(self) -> int:
+        """Approximate number of frames waiting for inference."""
+        return self.frame_queue.qsize()
 
     def get_result(self, timeout: float = 0.1) -> Optional[Any]:
         try:
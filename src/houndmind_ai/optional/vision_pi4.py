@@ -3,13 +3,17 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Optional, Any
+from typing import TYPE_CHECKING, Optional, Any
 
 from houndmind_ai.core.module import Module
-from houndmind_ai.optional.vision_preprocessing import VisionPreprocessor
 from houndmind_ai.optional.vision_inference_scheduler import VisionInferenceScheduler
 
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+    # Pulls in cv2/NumPy; imported in start() so the runtime loads without them.
+    from houndmind_ai.optional.vision_preprocessing import VisionPreprocessor
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +47,12 @@ class VisionPi4Module(Module):
         backend = settings.get("backend", "picamera2")
 
         # Setup preprocessor and inference scheduler if enabled
-        self._preprocessor = VisionPreprocessor(settings.get("preprocessing", {}))
+        try:
+            from houndmind_ai.optional.vision_preprocessing import VisionPreprocessor
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Vision preprocessing unavailable: %s", exc)
+        else:
+            self._preprocessor = VisionPreprocessor(settings.get("preprocessing", {}))
         if settings.get("inference_scheduler_enabled", True):
             def _on_inference_result(result):
                 self._last_inference_result = result
@@ -135,6 +144,10 @@ class VisionPi4Module(Module):
                 try:
                     processed = self._preprocessor.process(frame)
                     self._inference_scheduler.submit_frame(processed)
+                    context.set(
+                        "vision_inference_dropped",
+                        self._inference_scheduler.dropped_frames,
+                    )
                 except Exception as exc:
                     logger.warning("Vision preprocessing/inference failed: %s", exc)
 
@@ -156,13 +169,16 @@ class VisionPi4Module(Module):
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Vision HTTP server shutdown failed: %s", exc)
         if self._inference_scheduler:
-            self._inference_scheduler.stop()
+            self._inference_scheduler.stop(timeout=self.stop_timeout(context, 2.0))
             self._inference_scheduler = None
 
     def _maybe_start_http(self, settings: dict) -> None:
         http_settings = settings.get("http", {})
         if not http_settings.get("enabled", False):
             return
+        # Only needed when serving; keeps http.server off the import path.
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
         host = http_settings.get("host", "0.0.0.0")
         port = int(http_settings.get("port", 8090))
 
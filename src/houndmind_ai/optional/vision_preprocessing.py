@@ -11,8 +11,12 @@ class VisionPreprocessor:
         self.target_size = tuple(self.config.get("resize", (224, 224)))
         self.normalize = self.config.get("normalize", True)
         self.roi = self.config.get("roi", None)  # (x, y, w, h) or None
-        self.mean = np.array(self.config.get("mean", [0.485, 0.456, 0.406]))
-        self.std = np.array(self.config.get("std", [0.229, 0.224, 0.225]))
+        self.mean = np.array(self.config.get("mean", [0.485, 0.456, 0.406]), dtype=np.float32)
+        self.std = np.array(self.config.get("std", [0.229, 0.224, 0.225]), dtype=np.float32)
+        # (x / 255 - mean) / std folded into one float32 scale and offset so
+        # normalization never upcasts the frame to float64.
+        self._scale = (1.0 / (255.0 * self.std)).astype(np.float32)
+        self._offset = (self.mean / self.std).astype(np.float32)
 
     def process(self, frame):
         # ROI selection
@@ -23,6 +27,7 @@ class VisionPreprocessor:
         frame = cv2.resize(frame, self.target_size, interpolation=cv2.INTER_LINEAR)
         # Normalize
         if self.normalize:
-            frame = frame.astype(np.float32) / 255.0
-            frame = (frame - self.mean) / self.std
+            frame = frame.astype(np.float32)
+            frame *= self._scale
+            frame -= self._offset
         return frame
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs, urlparse
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from houndmind_ai.core.module import Module
 
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +31,8 @@ class VoiceModule(Module):
     - stt.enabled: bool
     - stt.backend: auto|vosk|speech_recognition
     - stt.vosk_model_path: path to VOSK model directory (optional)
+    - stt.local_spotter.enabled/wake_words: gate network recognition behind an
+      offline VOSK wake-word spotter (needs stt.vosk_model_path)
     - tts.enabled: bool
     - tts.backend: auto|pyttsx3|pidog
     """
@@ -45,6 +50,10 @@ class VoiceModule(Module):
         self._stt_stop = threading.Event()
         self._tts_engine: Any | None = None
         self._pidog: Any | None = None
+        self._wake_words: tuple[str, ...] = ()
+        # Compiled alternation over command_map keys, rebuilt when keys change.
+        self._command_keys: tuple[str, ...] = ()
+        self._command_re: re.Pattern[str] | None = None
 
     def start(self, context) -> None:
         if not self.status.enabled:
@@ -72,6 +81,7 @@ class VoiceModule(Module):
         # Start STT listener if requested
         stt_cfg = settings.get("stt", {})
         if stt_cfg.get("enabled", False):
+            self._stt_stop.clear()
             self._stt_thread = threading.Thread(
                 target=self._stt_loop, args=(context,), daemon=True
             )
@@ -148,11 +158,25 @@ class VoiceModule(Module):
                 return str(mapping[alias])
             if isinstance(alias, str):
                 return alias
-        for key, value in mapping.items():
-            if key in text:
-                return str(value)
+        pattern = self._command_pattern(mapping)
+        if pattern is None:
+            return None
+        match = pattern.search(text)
+        if match:
+            return str(mapping[match.group(0)])
         return None
 
+    def _command_pattern(self, mapping: dict) -> re.Pattern[str] | None:
+        keys = tuple(str(k) for k in mapping if k)
+        if keys != self._command_keys:
+            self._command_keys = keys
+            # Longest keys first so "wag tail" wins over "wag" at the same offset.
+            ordered = sorted(keys, key=len, reverse=True)
+            self._command_re = (
+                re.compile("|".join(re.escape(k) for k in ordered)) if ordered else None
+            )
+        return self._command_re
+
     def _apply_action(self, action: str, context) -> None:
         # Use behavior override so safety/navigation still take priority.
         context.set("behavior_override", action)
@@ -210,6 +234,8 @@ class VoiceModule(Module):
         http_settings = settings.get("http", {})
         if not http_settings.get("enabled", False):
             return
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
         host = http_settings.get("host", "0.0.0.0")
         port = int(http_settings.get("port", 8091))
 
@@ -307,11 +333,16 @@ class VoiceModule(Module):
                 mic = sr.Microphone()
                 with mic as source:
                     r.adjust_for_ambient_noise(source, duration=1)
+                spotter = self._build_wake_spotter(stt_cfg)
                 logger.info("SpeechRecognition STT started (using default recognizer)")
                 while not self._stt_stop.is_set():
                     try:
                         with mic as source:
                             audio = r.listen(source, phrase_time_limit=5)
+                        if spotter is not None and not self._wake_word_heard(
+                            spotter, audio
+                        ):
+                            continue
                         try:
                             text = r.recognize_google(audio)
                         except sr.RequestError:
@@ -374,14 +405,47 @@ class VoiceModule(Module):
 
         logger.info("No STT backend available; STT loop exiting")
 
-    def stop(self, context) -> None:
-        # Stop STT thread
+    def _build_wake_spotter(self, stt_cfg: dict) -> Any | None:
+        """Return a VOSK recognizer restricted to the wake words, or None."""
+        spotter_cfg = stt_cfg.get("local_spotter", {})
+        if not spotter_cfg.get("enabled", False):
+            return None
+        words = [
+            self._normalize(str(w)) for w in spotter_cfg.get("wake_words", []) if w
+        ]
+        model_path = stt_cfg.get("vosk_model_path")
+        if not words or not model_path:
+            logger.warning("Wake-word spotter needs wake_words and vosk_model_path")
+            return None
         try:
-            if self._stt_thread is not None:
-                self._stt_stop.set()
-                self._stt_thread.join(timeout=1)
+            from vosk import KaldiRecognizer, Model  # type: ignore
+
+            # A closed grammar keeps decoding cheap; "[unk]" absorbs other speech.
+            grammar = json.dumps(words + ["[unk]"])
+            spotter = KaldiRecognizer(Model(model_path), 16000, grammar)
         except Exception:
-            logger.exception("Failed to stop STT thread")
+            logger.exception("Wake-word spotter init failed; using network STT only")
+            return None
+        self._wake_words = tuple(words)
+        logger.info("Wake-word spotter enabled: %s", ", ".join(words))
+        return spotter
+
+    def _wake_word_heard(self, spotter: Any, audio: Any) -> bool:
+        try:
+            spotter.AcceptWaveform(
+                audio.get_raw_data(convert_rate=16000, convert_width=2)
+            )
+            text = json.loads(spotter.FinalResult()).get("text", "")
+        except Exception:
+            logger.debug("Wake-word spotter failed", exc_info=True)
+            # Fail open so a broken spotter never silences voice control.
+            return True
+        return any(word in text for word in self._wake_words)
+
+    def stop(self, context) -> None:
+        # Signal the STT thread first so it winds down while the HTTP server
+        # shuts down, then join it; the two waits overlap instead of adding up.
+        self._stt_stop.set()
 
         if self._http_server is not None:
             try:
@@ -390,6 +454,12 @@ class VoiceModule(Module):
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Failed to stop voice HTTP server: %s", exc)
 
+        try:
+            if self._stt_thread is not None:
+                self._stt_thread.join(timeout=self.stop_timeout(context, 1.0))
+        except Exception:
+            logger.exception("Failed to stop STT thread")
+
         # Stop pyttsx3 engine if present
         try:
             if self._tts_engine is not None:
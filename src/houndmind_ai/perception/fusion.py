@@ -64,17 +64,16 @@ class PerceptionModule(Module):
         if isinstance(distance, (int, float)) and distance > 0:
             obstacle = distance < obstacle_cm
 
-        context.set(
-            "perception",
-            {
-                "obstacle": obstacle,
-                "touch": touch,
-                "sound": bool(sound_detected),
-                "sound_direction": sound_direction,
-                "distance": distance,
-            },
-        )
-        logger.debug("Perception: %s", context.get("perception"))
+        perception = {
+            "obstacle": obstacle,
+            "touch": touch,
+            "sound": bool(sound_detected),
+            "sound_direction": sound_direction,
+            "distance": distance,
+        }
+        context.set("perception", perception)
+        # Lazy %-args: the dict is only rendered when DEBUG is enabled.
+        logger.debug("Perception: %s", perception)
 
         # Emit pose_hint when distance is a reasonable anchor and IMU heading exists.
         try:
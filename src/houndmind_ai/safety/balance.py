@@ -3,11 +3,49 @@ from __future__ import annotations
 import logging
 import math
 import time
+from dataclasses import dataclass
 
+from houndmind_ai.core.config import SettingsCache
 from houndmind_ai.core.module import Module
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_ACTIVE_ACTIONS = ("forward", "backward", "turn left", "turn right", "trot")
+
+
+@dataclass(frozen=True)
+class _BalanceParams:
+    enabled: bool
+    # Minimum seconds between updates (1 / update_hz); 0 disables throttling.
+    interval_s: float
+    # Actions that allow compensation; None when active regardless of action.
+    active_actions: frozenset[str] | None
+    scale: float
+    max_pitch: float
+    max_roll: float
+    # Low-pass filter weight, or None when lpf_alpha is outside (0, 1].
+    alpha: float | None
+
+    @staticmethod
+    def from_settings(settings: dict) -> _BalanceParams:
+        balance = settings.get("balance", {})
+        update_hz = float(balance.get("update_hz", 10.0))
+        active_actions = None
+        if balance.get("active_when_moving", True):
+            allowed = balance.get("active_actions", _DEFAULT_ACTIVE_ACTIONS)
+            if allowed:
+                active_actions = frozenset(allowed)
+        alpha = float(balance.get("lpf_alpha", 0.4))
+        return _BalanceParams(
+            enabled=bool(balance.get("enabled", True)),
+            interval_s=1.0 / update_hz if update_hz > 0 else 0.0,
+            active_actions=active_actions,
+            scale=float(balance.get("compensation_scale", 1.0)),
+            max_pitch=float(balance.get("max_pitch_deg", 12.0)),
+            max_roll=float(balance.get("max_roll_deg", 12.0)),
+            alpha=alpha if 0.0 < alpha <= 1.0 else None,
+        )
+
 
 class BalanceModule(Module):
     """IMU balance compensation using roll/pitch from accelerometer.
@@ -20,25 +58,21 @@ class BalanceModule(Module):
         self._last_ts = 0.0
         self._roll_lpf = 0.0
         self._pitch_lpf = 0.0
+        self._params = SettingsCache(_BalanceParams.from_settings)
 
     def tick(self, context) -> None:
-        settings = (context.get("settings") or {}).get("balance", {})
-        if not settings.get("enabled", True):
+        params = self._params.get(context.get("settings") or {})
+        if not params.enabled:
             return
 
-        update_hz = float(settings.get("update_hz", 10.0))
         now = time.time()
-        if update_hz > 0 and (now - self._last_ts) < (1.0 / update_hz):
+        if (now - self._last_ts) < params.interval_s:
             return
         self._last_ts = now
 
-        if settings.get("active_when_moving", True):
+        if params.active_actions is not None:
             action = str(context.get("navigation_action") or "")
-            allowed = settings.get(
-                "active_actions",
-                ["forward", "backward", "turn left", "turn right", "trot"],
-            )
-            if allowed and action not in allowed:
+            if action not in params.active_actions:
                 return
 
         reading = context.get("sensor_reading")
@@ -54,17 +88,16 @@ class BalanceModule(Module):
         pitch = math.degrees(math.atan2(ay, math.sqrt(ax * ax + az * az)))
         roll = math.degrees(math.atan2(-ax, az))
 
-        scale = float(settings.get("compensation_scale", 1.0))
-        pitch *= scale
-        roll *= scale
+        pitch *= params.scale
+        roll *= params.scale
 
-        max_pitch = float(settings.get("max_pitch_deg", 12.0))
-        max_roll = float(settings.get("max_roll_deg", 12.0))
+        max_pitch = params.max_pitch
+        max_roll = params.max_roll
         pitch = max(-max_pitch, min(max_pitch, pitch))
         roll = max(-max_roll, min(max_roll, roll))
 
-        alpha = float(settings.get("lpf_alpha", 0.4))
-        if 0.0 < alpha <= 1.0:
+        alpha = params.alpha
+        if alpha is not None:
             self._pitch_lpf = (1 - alpha) * self._pitch_lpf + alpha * pitch
             self._roll_lpf = (1 - alpha) * self._roll_lpf + alpha * roll
             pitch = self._pitch_lpf
@@ -150,17 +150,13 @@ class HealthMonitorModule(Module):
                 self._high_water[key] = value
         context.set("health_high_water", self._high_water)
 
-        status_enabled = bool(logging_settings.get("status_log_enabled", True))
-        status_interval = float(logging_settings.get("status_log_interval_s", 10.0))
-        last_status = float(context.get("health_status_last_log_ts") or 0.0)
-        if status_enabled and now - last_status >= status_interval:
-            context.set("health_status_last_log_ts", now)
-            logger.info(
-                "Health: load=%.2f temp=%sC mem=%s%% degraded=%s",
-                load_1m if load_1m is not None else -1.0,
-                f"{temp_c:.1f}" if temp_c is not None else "n/a",
-                f"{mem_pct:.1f}" if mem_pct is not None else "n/a",
-                degraded,
+        # Check the logger first so a quiet INFO level skips the settings parse
+        # and the value formatting below entirely.
+        if logger.isEnabledFor(logging.INFO) and bool(
+            logging_settings.get("status_log_enabled", True)
+        ):
+            self._log_status(
+                context, logging_settings, now, load_1m, temp_c, mem_pct, degraded
             )
 
         actions = perf.get("health_actions", ["throttle_scans"])
@@ -189,6 +185,29 @@ class HealthMonitorModule(Module):
         else:
             context.set("vision_frame_interval_override_s", None)
 
+    @staticmethod
+    def _log_status(
+        context,
+        logging_settings: dict,
+        now: float,
+        load_1m: float | None,
+        temp_c: float | None,
+        mem_pct: float | None,
+        degraded: bool,
+    ) -> None:
+        status_interval = float(logging_settings.get("status_log_interval_s", 10.0))
+        last_status = float(context.get("health_status_last_log_ts") or 0.0)
+        if now - last_status < status_interval:
+            return
+        context.set("health_status_last_log_ts", now)
+        logger.info(
+            "Health: load=%.2f temp=%sC mem=%s%% degraded=%s",
+            load_1m if load_1m is not None else -1.0,
+            f"{temp_c:.1f}" if temp_c is not None else "n/a",
+            f"{mem_pct:.1f}" if mem_pct is not None else "n/a",
+            degraded,
+        )
+
     def start(self, context) -> None:
         context.set("health_degraded", False)
         context.set("scan_interval_override_s", None)
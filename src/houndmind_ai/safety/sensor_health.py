@@ -14,7 +14,8 @@ class SensorHealthModule(Module):
         super().__init__(name, enabled=enabled, required=required)
         self._last_status: Optional[str] = None
         self._last_led: Optional[str] = None
-        self._last_log_ts = 0.0
+        # Deadline for the next periodic status log (epoch seconds).
+        self._next_log_ts = 0.0
 
     def tick(self, context) -> None:
         settings = (context.get("settings") or {}).get("sensor_health", {})
@@ -65,7 +66,11 @@ class SensorHealthModule(Module):
             context.set("led_request:health", {"mode": "health", "color": led_color})
             self._last_led = led_color
         # Log if changed or periodically
-        if (self._last_status != status or now - self._last_log_ts > 10) and settings.get("log_enabled", True):
-            logger.info(f"Sensor health status: {status} details: {details}")
-            self._last_log_ts = now
+        if (
+            (self._last_status != status or now >= self._next_log_ts)
+            and settings.get("log_enabled", True)
+            and logger.isEnabledFor(logging.INFO)
+        ):
+            logger.info("Sensor health status: %s details: %s", status, details)
+            self._next_log_ts = now + float(settings.get("log_interval_s", 10.0))
         self._last_status = status
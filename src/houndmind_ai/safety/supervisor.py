@@ -1,12 +1,23 @@
 from __future__ import annotations
 
 import logging
+import math
 import time
 
 from houndmind_ai.core.module import Module
 
 logger = logging.getLogger(__name__)
 
+# Default override order: earlier items are higher priority.
+_DEFAULT_OVERRIDE_PRIORITY = ("safety", "watchdog", "navigation", "behavior")
+# Logical override priorities -> context keys holding their pending action.
+_PRIORITY_ACTION_KEYS = {
+    "safety": "safety_action",
+    "watchdog": "watchdog_action",
+    "navigation": "navigation_action",
+    "behavior": "behavior_action",
+}
+
 
 class SafetyModule(Module):
     def __init__(self, name: str, enabled: bool = True, required: bool = False) -> None:
@@ -65,8 +76,6 @@ class SafetyModule(Module):
                 sensors = context.get("sensors") or {}
                 acc = sensors.get("acc")
             if acc is not None and len(acc) >= 3:
-                import math
-
                 ax, ay, az = float(acc[0]), float(acc[1]), float(acc[2])
                 # Compute small-angle-safe pitch/roll in degrees.
                 pitch = math.degrees(math.atan2(-ax, math.sqrt(ay * ay + az * az)))
@@ -148,12 +157,9 @@ class SafetyModule(Module):
         # Pull safety settings for override behavior.
         settings = (context.get("settings") or {}).get("safety", {})
         # Ordered priority list: earlier items are higher priority.
-        priority = settings.get(
-            "override_priority",
-            ["safety", "watchdog", "navigation", "behavior"],
-        )
-        if not isinstance(priority, list) or not priority:
-            priority = ["safety", "watchdog", "navigation", "behavior"]
+        priority = settings.get("override_priority", _DEFAULT_OVERRIDE_PRIORITY)
+        if not isinstance(priority, (list, tuple)) or not priority:
+            priority = _DEFAULT_OVERRIDE_PRIORITY
 
         # Avoid rewriting context on every tick when already active.
         if self._last_override_active:
@@ -165,17 +171,10 @@ class SafetyModule(Module):
         if not clear_lower:
             return
 
-        # Map logical priorities to context keys for action overrides.
-        priority_map = {
-            "safety": "safety_action",
-            "watchdog": "watchdog_action",
-            "navigation": "navigation_action",
-            "behavior": "behavior_action",
-        }
         if "safety" not in priority:
             return
         safety_index = priority.index("safety")
         for name in priority[safety_index + 1 :]:
-            key = priority_map.get(str(name))
+            key = _PRIORITY_ACTION_KEYS.get(str(name))
             if key:
                 context.set(key, None)
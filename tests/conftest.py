@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate_config_cache(tmp_path, monkeypatch):
+    # load_config writes a parse cache under XDG_CACHE_HOME; keep it out of ~.
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
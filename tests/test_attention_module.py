@@ -34,3 +34,29 @@ def test_attention_turns_head_on_sound():
 
     dog = ctx.get("pidog")
     assert dog.calls, "head_move should be called when sound is detected"
+
+
+def test_attention_params_cached_without_attention_section(monkeypatch):
+    from houndmind_ai.behavior import attention
+
+    builds = []
+    real = attention._AttentionParams.from_settings
+
+    def counting(settings):
+        builds.append(settings)
+        return real(settings)
+
+    monkeypatch.setattr(attention._AttentionParams, "from_settings", counting)
+    ctx = DummyContext()
+    ctx.set("pidog", DummyDog())
+    ctx.set("settings", {"behavior": {}})
+    ctx.set("perception", {"sound": True, "sound_direction": 90})
+
+    module = AttentionModule("attention")
+    for _ in range(3):
+        module.tick(ctx)
+    assert len(builds) == 1
+
+    ctx.set("settings", {"attention": {"sound_cooldown_s": 0.0}})
+    module.tick(ctx)
+    assert len(builds) == 2
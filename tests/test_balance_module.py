@@ -34,3 +34,22 @@ def test_balance_module_sets_rpy():
 
     dog = ctx.get("pidog")
     assert dog.calls, "set_rpy should be called when enabled"
+
+
+def test_balance_module_reparses_replaced_settings():
+    ctx = DummyContext()
+    ctx.set("pidog", DummyDog())
+    ctx.set("settings", {"balance": {"enabled": True, "update_hz": 0.0}})
+    ctx.set("navigation_action", "sit")
+    ctx.set("sensor_reading", type("R", (), {"acc": (0.0, 0.0, 1.0)})())
+
+    module = BalanceModule("balance")
+    module.tick(ctx)
+    assert not ctx.get("pidog").calls, "sit is not an active action by default"
+
+    ctx.set(
+        "settings",
+        {"balance": {"enabled": True, "update_hz": 0.0, "active_actions": ["sit"]}},
+    )
+    module.tick(ctx)
+    assert ctx.get("pidog").calls
@@ -0,0 +1,71 @@
+from houndmind_ai.behavior.fsm import BehaviorModule, BehaviorState
+from houndmind_ai.core.runtime import RuntimeContext
+
+
+def test_autonomy_mode_maps_to_state_and_action():
+    mod = BehaviorModule("behavior", enabled=True)
+    ctx = RuntimeContext()
+    ctx.set(
+        "settings",
+        {
+            "behavior": {
+                "catalog": {"explore": ["sniff"]},
+                "action_sets": {"explore": "explore"},
+            }
+        },
+    )
+    mod._select_autonomy_mode = lambda settings, context: "explore"
+    mod.tick(ctx)
+    assert mod.state == BehaviorState.EXPLORE
+    assert ctx.get("behavior_action") == "sniff"
+
+
+def test_unknown_autonomy_mode_falls_back_to_idle():
+    mod = BehaviorModule("behavior", enabled=True)
+    ctx = RuntimeContext()
+    ctx.set("settings", {"behavior": {}})
+    mod._select_autonomy_mode = lambda settings, context: "dance"
+    mod.tick(ctx)
+    assert mod.state == BehaviorState.IDLE
+    assert ctx.get("behavior_action") == "stand"
+
+
+def test_transition_guard_waits_for_confirm_ticks():
+    mod = BehaviorModule("behavior", enabled=True)
+    ctx = RuntimeContext()
+    ctx.set(
+        "settings",
+        {
+            "behavior": {
+                "transition_guard_enabled": True,
+                "transition_min_dwell_s": 0.0,
+                "transition_confirm_ticks": 2,
+            }
+        },
+    )
+    mod._select_autonomy_mode = lambda settings, context: "explore"
+    mod.tick(ctx)
+    assert mod.state == BehaviorState.IDLE
+    mod.tick(ctx)
+    assert mod.state == BehaviorState.EXPLORE
+    mod.tick(ctx)
+    assert mod.state == BehaviorState.EXPLORE
+
+
+def test_touch_and_sound_share_alert_state():
+    for perception in ({"touch": "LS"}, {"sound": True}):
+        mod = BehaviorModule("behavior", enabled=True)
+        ctx = RuntimeContext()
+        ctx.set(
+            "settings",
+            {
+                "behavior": {
+                    "catalog": {"alert": ["bark"]},
+                    "action_sets": {"alert": "alert"},
+                }
+            },
+        )
+        ctx.set("perception", perception)
+        mod.tick(ctx)
+        assert mod.state == BehaviorState.ALERT
+        assert ctx.get("behavior_action") == "bark"
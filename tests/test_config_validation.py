@@ -1,6 +1,8 @@
+from pathlib import Path
+import tempfile
 import unittest
 
-from houndmind_ai.core.config import Config, LoopConfig, validate_config
+from houndmind_ai.core.config import Config, LoopConfig, load_config, validate_config
 
 
 class ConfigValidationTests(unittest.TestCase):
@@ -42,6 +44,30 @@ class ConfigValidationTests(unittest.TestCase):
         self.assertIn("balance.max_roll_deg should be > 0", warnings)
         self.assertIn("balance.lpf_alpha should be in (0, 1]", warnings)
 
+    def test_valid_values_produce_no_warnings(self) -> None:
+        config = Config(
+            loop=LoopConfig(tick_hz=5, max_cycles=1),
+            modules={},
+            settings={
+                "movement": {"speed_normal": 80, "speed_turn_normal": 200},
+                "balance": {"update_hz": 10, "lpf_alpha": 1.0},
+                "navigation": {"scan_min_valid_ratio": "0.5"},
+            },
+        )
+        self.assertEqual(validate_config(config), [])
+
+    def test_load_config_reports_warnings_in_one_record(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "settings.jsonc"
+            path.write_text(
+                '{"loop": {"tick_hz": 0, "max_cycles": 0}}', encoding="utf-8"
+            )
+            with self.assertLogs("houndmind_ai.core.config", "WARNING") as logs:
+                load_config(path)
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("Config warnings (2)", logs.output[0])
+        self.assertIn("loop.max_cycles should be > 0 when set", logs.output[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,23 @@
+from houndmind_ai.navigation.obstacle_avoidance import ObstacleAvoidanceModule
+
+
+def test_dead_end_tallies_track_evictions():
+    mod = ObstacleAvoidanceModule("navigation")
+    for direction in ["left"] * 5:
+        mod._record_turn(direction)
+    assert mod._is_dead_end("left")
+    assert not mod._is_dead_end("right")
+
+    # Push enough right turns to evict most of the lefts from the window.
+    for direction in ["right"] * 3:
+        mod._record_turn(direction)
+    assert (mod._dead_end_left, mod._dead_end_right) == (2, 3)
+    assert mod._is_dead_end("right")
+    assert not mod._is_dead_end("left")
+
+
+def test_dead_end_requires_full_window():
+    mod = ObstacleAvoidanceModule("navigation")
+    for direction in ["left"] * 4:
+        mod._record_turn(direction)
+    assert not mod._is_dead_end("left")
@@ -1,4 +1,5 @@
 from houndmind_ai.behavior.fsm import BehaviorModule
+from houndmind_ai.optional.energy_emotion import EnergyEmotionModule
 
 
 class DummyContext:
@@ -41,3 +42,18 @@ def test_energy_boost_on_touch_and_sound():
     module.tick(ctx)
     e2 = ctx.get("energy_level")
     assert e2 is not None and e2 > e1
+
+
+def test_energy_emotion_module_reparses_replaced_settings():
+    ctx = DummyContext()
+    ctx.set("settings", {"energy": {"initial": 0.5, "decay_per_tick": 0.1}})
+    module = EnergyEmotionModule("energy_emotion")
+
+    module.tick(ctx)
+    assert abs(ctx.get("energy_level") - 0.4) < 1e-6
+
+    ctx.set("settings", {"energy": {"decay_per_tick": 0.2, "boost_touch": 0.3}})
+    ctx.set("perception", {"touch": "T"})
+    module.tick(ctx)
+    assert abs(ctx.get("energy_level") - 0.5) < 1e-6
+    assert ctx.get("emotion_state") == "calm"
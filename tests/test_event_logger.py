@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from houndmind_ai.core.runtime import RuntimeContext
+from houndmind_ai.logging import event_logger
+from houndmind_ai.logging.event_logger import EventLoggerModule
+
+
+def test_event_logger_writes_snapshots_and_summary(tmp_path):
+    log_path = tmp_path / "nested" / "events.jsonl"
+    ctx = RuntimeContext()
+    ctx.set(
+        "settings",
+        {"logging": {"event_log_interval_s": 0.0, "event_log_path": str(log_path)}},
+    )
+    module = EventLoggerModule("event_logger")
+
+    ctx.set("navigation_action", "forward")
+    module.tick(ctx)
+    ctx.set("navigation_action", "turn left")
+    module.tick(ctx)
+    module.stop(ctx)
+
+    lines = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [line["type"] for line in lines] == ["snapshot", "snapshot", "summary"]
+    assert lines[-1]["navigation_action_counts"] == {"forward": 1, "turn left": 1}
+    assert ctx.get("event_log_report")["total_events"] == 2
+
+
+def test_encode_line_matches_stdlib_fallback(monkeypatch):
+    event = {"type": "snapshot", "scan_result": {"forward": 42.5}, "count": 3}
+    fast = event_logger._encode_line(event)
+    monkeypatch.setattr(event_logger, "orjson", None)
+    slow = event_logger._encode_line(event)
+    assert fast.endswith(b"\n") and slow.endswith(b"\n")
+    assert json.loads(fast) == json.loads(slow) == event
+
+
+def test_encode_line_accepts_numpy_scalars_and_big_ints():
+    np = pytest.importorskip("numpy")
+    event = {"distance": np.float64(42.5), "count": np.int64(3)}
+    assert json.loads(event_logger._encode_line(event)) == {"distance": 42.5, "count": 3}
+    event = {"distance": np.float64(42.5), "big": 1 << 70}
+    assert json.loads(event_logger._encode_line(event)) == {"distance": 42.5, "big": 1 << 70}
+
+
+def test_event_logger_reopens_when_path_changes(tmp_path):
+    first = tmp_path / "a.jsonl"
+    second = tmp_path / "b.jsonl"
+    settings = {"event_log_path": str(first)}
+    module = EventLoggerModule("event_logger")
+
+    module._write_jsonl({"n": 1}, settings)
+    module._write_jsonl({"n": 2}, settings)
+    settings["event_log_path"] = str(second)
+    module._write_jsonl({"n": 3}, settings)
+    module._close_log()
+
+    assert len(first.read_text().splitlines()) == 2
+    assert json.loads(second.read_text()) == {"n": 3}
+
+
+def test_event_logger_report_counts_track_ring_buffer():
+    settings = {"event_log_max_entries": 2, "event_log_file_enabled": False}
+    module = EventLoggerModule("event_logger")
+
+    first = {"navigation_action": "forward", "stuck_recovery": 1}
+    module._append_event(first, settings)
+    module._append_event({"navigation_action": "forward"}, settings)
+    module._append_event({"navigation_action": "turn left"}, settings)
+    report = module._generate_report()
+
+    assert report["total_events"] == 2
+    assert report["stuck_events"] == 0
+    assert report["navigation_action_counts"] == {"forward": 1, "turn left": 1}
+
+
+def test_event_logger_flushes_in_batches(tmp_path):
+    path = tmp_path / "events.jsonl"
+    settings = {"event_log_path": str(path), "event_log_flush_every": 2}
+    module = EventLoggerModule("event_logger")
+
+    module._write_jsonl({"n": 1}, settings)
+    assert path.read_text() == ""
+    module._write_jsonl({"n": 2}, settings)
+    module._write_jsonl({"n": 3}, settings)
+    assert len(path.read_text().splitlines()) == 2
+    module._close_log()
+
+    assert len(path.read_text().splitlines()) == 3
@@ -22,3 +22,16 @@ def test_grid_bias_no_cells_fallback():
     settings = {"use_grid_map": True}
     choice = module._apply_grid_bias(ctx, settings, "left")
     assert choice == "left", "Should return fallback when no grid cells present"
+
+
+def test_grid_bias_reuses_parsed_keys_and_skips_bad_ones():
+    ctx = RuntimeContext()
+    module = ObstacleAvoidanceModule("avoid_test")
+    cells = {"-1,1": 1, "1,1": 4, "bogus": 9}
+    ctx.set("mapping_state", {"grid": {"cells": cells}})
+    settings = {"use_grid_map": True, "grid_bias_weight": 0.7}
+    assert module._apply_grid_bias(ctx, settings, "forward") == "left"
+
+    # Counts change between calls; cached key positions must still apply.
+    cells["-1,1"] = 10
+    assert module._apply_grid_bias(ctx, settings, "forward") == "right"
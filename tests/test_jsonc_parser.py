@@ -30,3 +30,61 @@ def test_load_jsonc_unterminated_block_comment_raises(tmp_path: Path):
     with pytest.raises(ValueError) as excinfo:
         cfg._load_jsonc(p)
     assert "Unterminated block comment" in str(excinfo.value)
+
+
+def test_load_jsonc_cached_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("HOUNDMIND_CONFIG_CACHE", raising=False)
+    p = tmp_path / "settings.jsonc"
+    p.write_text('{"loop": {"tick_hz": 5}} // five', encoding="utf-8")
+    assert cfg._load_jsonc_cached(p) == {"loop": {"tick_hz": 5}}
+
+    def fail(path):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr(cfg, "_load_jsonc", fail)
+    assert cfg._load_jsonc_cached(p) == {"loop": {"tick_hz": 5}}
+
+    monkeypatch.undo()
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    p.write_text('{"loop": {"tick_hz": 10}} // ten!', encoding="utf-8")
+    assert cfg._load_jsonc_cached(p) == {"loop": {"tick_hz": 10}}
+
+
+def test_load_jsonc_cached_detects_same_size_edit_with_same_mtime(tmp_path):
+    import os
+
+    p = tmp_path / "settings.jsonc"
+    p.write_text('{"loop": {"tick_hz": 5}}', encoding="utf-8")
+    stat = p.stat()
+    assert cfg._load_jsonc_cached(p) == {"loop": {"tick_hz": 5}}
+    p.write_text('{"loop": {"tick_hz": 7}}', encoding="utf-8")
+    os.utime(p, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cfg._load_jsonc_cached(p) == {"loop": {"tick_hz": 7}}
+
+
+def test_load_jsonc_cached_reads_cache_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("HOUNDMIND_CONFIG_CACHE", raising=False)
+    p = tmp_path / "settings.jsonc"
+    p.write_text('{"name": "höund", "n": [1, 2.5]} // c', encoding="utf-8")
+    expected = {"name": "höund", "n": [1, 2.5]}
+    assert cfg._load_jsonc_cached(p) == expected
+
+    # The cache must also read back when orjson is not installed.
+    monkeypatch.setattr(cfg, "orjson", None)
+    monkeypatch.setattr(cfg, "_load_jsonc", lambda path: {})
+    assert cfg._load_jsonc_cached(p) == expected
+
+
+def test_load_jsonc_cached_keeps_non_finite_floats(tmp_path, monkeypatch):
+    import math
+
+    p = tmp_path / "settings.jsonc"
+    p.write_text('{"a": NaN, "b": Infinity} // c', encoding="utf-8")
+    cold = cfg._load_jsonc_cached(p)
+    monkeypatch.setattr(cfg, "_load_jsonc", lambda path: {})
+    warm = cfg._load_jsonc_cached(p)
+    for data in (cold, warm):
+        assert math.isnan(data["a"])
+        assert data["b"] == math.inf
@@ -54,3 +54,29 @@ def test_led_manager_priority_selection():
     mode, color, _, _ = dog.rgb_strip.calls[-1]
     assert mode == "boom"
     assert color == "red"
+
+
+def test_led_manager_navigation_mode_styles():
+    ctx = DummyContext()
+    ctx.set("pidog", DummyDog())
+    ctx.set(
+        "settings",
+        {
+            "led": {"enabled": True, "priority": ["navigation"], "cooldown_s": 0.0},
+            "navigation": {"led_turn_color": "yellow"},
+        },
+    )
+    module = LedManagerModule("led_manager")
+    dog = ctx.get("pidog")
+
+    ctx.set("led_request:navigation", {"mode": "turn"})
+    module.tick(ctx)
+    assert dog.rgb_strip.calls[-1][:2] == ("listen", "yellow")
+
+    ctx.set("led_request:navigation", {"mode": "obstacle"})
+    module.tick(ctx)
+    assert dog.rgb_strip.calls[-1][:2] == ("bark", "red")
+
+    ctx.set("led_request:navigation", {"mode": "unknown"})
+    module.tick(ctx)
+    assert dog.rgb_strip.calls[-1][:2] == ("breath", "blue")
@@ -1,3 +1,5 @@
+import json
+
 from houndmind_ai.mapping.mapper import MappingModule
 
 
@@ -24,3 +26,31 @@ def test_analyze_scan_openings_basic():
     # Best path should be a dict and correspond to the longest/widest candidate
     assert best_path is not None
     assert best_path.get("distance_cm", 0) >= 60
+
+
+def test_save_home_map_replaces_file_without_leftovers(tmp_path):
+    path = tmp_path / "home_map.json"
+    path.write_text("stale", encoding="utf-8")
+    module = MappingModule("mapping")
+
+    state = {"samples": [{"timestamp": 1.0}]}
+    module.save_home_map(state, {"home_map_path": str(path)})
+
+    assert json.loads(path.read_text())["samples"] == [{"timestamp": 1.0}]
+    assert [p.name for p in tmp_path.iterdir()] == ["home_map.json"]
+
+
+def test_save_home_map_skips_unchanged_samples(tmp_path):
+    path = tmp_path / "home_map.json"
+    settings = {"home_map_path": str(path)}
+    state = {"samples": [{"timestamp": 1.0}]}
+    module = MappingModule("mapping")
+
+    module.save_home_map(state, settings)
+    saved_at = json.loads(path.read_text())["meta"]["saved_at"]
+    module.save_home_map(state, settings)
+    assert json.loads(path.read_text())["meta"]["saved_at"] == saved_at
+
+    state["samples"].append({"timestamp": 2.0})
+    module.save_home_map(state, settings)
+    assert len(json.loads(path.read_text())["samples"]) == 2
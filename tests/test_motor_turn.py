@@ -0,0 +1,103 @@
+import time
+
+from houndmind_ai.core.runtime import RuntimeContext
+from houndmind_ai.hal.motors import MotorModule
+
+
+class TurningDog:
+    def __init__(self, ctx, deg_per_step=15.0):
+        self.ctx = ctx
+        self.deg_per_step = deg_per_step
+        self.calls = []
+
+    def do_action(self, name, step_count=1, speed=None):
+        self.calls.append((name, speed))
+        delta = self.deg_per_step if name == "turn_left" else -self.deg_per_step
+        self.ctx.set("current_heading", (self.ctx.get("current_heading") + delta) % 360)
+
+
+def _make(settings):
+    ctx = RuntimeContext()
+    ctx.set("settings", settings)
+    ctx.set("current_heading", 0.0)
+    module = MotorModule("hal_motors")
+    module.dog = TurningDog(ctx)
+    return ctx, module
+
+
+def test_turn_by_angle_reaches_target_with_configured_speed():
+    ctx, module = _make(
+        {
+            "movement": {"speed_turn_normal": 180, "speed_turn_slow": 90},
+            "orientation": {"turn_tolerance_deg": 5.0, "turn_timeout_s": 2.0},
+        }
+    )
+    assert module._turn_by_angle(ctx, {"direction": "right", "degrees": 30})
+    assert module.dog.calls == [("turn_right", 180), ("turn_right", 180)]
+
+    ctx.set("energy_speed_hint", "slow")
+    assert module._turn_by_angle(ctx, {"direction": "left", "steps": 1})
+    assert module.dog.calls[-1] == ("turn_left", 90)
+
+
+def test_turn_params_follow_settings_reload():
+    ctx, module = _make({"performance": {"safe_mode_enabled": True, "safe_mode_turn_speed": 60}})
+    assert module._turn_by_angle(ctx, {"direction": "left", "steps": 1})
+    assert module.dog.calls[-1] == ("turn_left", 60)
+
+    ctx.set("settings", {"movement": {"speed_turn_normal": 150}})
+    assert module._turn_by_angle(ctx, {"direction": "left", "steps": 1})
+    assert module.dog.calls[-1] == ("turn_left", 150)
+
+
+def test_head_follow_and_center_share_head_move():
+    ctx, module = _make(
+        {"motors": {"head_turn_follow_deg": 20, "head_turn_follow_speed": 55}}
+    )
+    moves = []
+    module.dog.head_move = lambda angles, speed=None: moves.append((angles, speed))
+
+    module._apply_head_follow("right", ctx)
+    module._apply_head_center(ctx)
+    assert moves == [([[-20.0, 0, 0]], 55), ([[0.0, 0, 0]], 55)]
+
+    ctx.set("settings", {"motors": {"head_turn_follow_deg": 0}})
+    module._apply_head_follow("left", ctx)
+    module._apply_head_center(ctx)
+    assert moves[-1] == ([[0.0, 0, 0]], 70) and len(moves) == 3
+
+
+def test_head_follow_respects_recent_scan_unless_disabled():
+    settings = {"motors": {"head_turn_follow_deg": 20}}
+    ctx, module = _make(settings)
+    moves = []
+    module.dog.head_move = lambda angles, speed=None: moves.append(angles)
+    ctx.set("attention_active_ts", 0.0)
+
+    ctx.set("scan_reading", type("Scan", (), {"timestamp": time.time()})())
+    module._apply_head_follow("left", ctx)
+    assert moves == []
+
+    motors = {**settings["motors"], "head_turn_follow_respect_scanning": False}
+    ctx.set("settings", {"motors": motors})
+    module._apply_head_follow("left", ctx)
+    assert moves == [[[20.0, 0, 0]]]
+
+
+def test_turn_speed_resolves_per_energy_hint():
+    ctx, module = _make(
+        {"movement": {"speed_turn_normal": 120, "speed_turn_fast": 240}}
+    )
+    for hint, expected in (("fast", 240), ("slow", 120), (None, 120), ("odd", 120)):
+        ctx.set("energy_speed_hint", hint)
+        assert module._turn_by_angle(ctx, {"direction": "left", "steps": 1})
+        assert module.dog.calls[-1] == ("turn_left", expected)
+
+
+def test_turn_by_angle_takes_short_way_across_north():
+    ctx, module = _make({"movement": {"turn_degrees_per_step": 15}})
+    ctx.set("current_heading", 350.0)
+
+    assert module._turn_by_angle(ctx, {"direction": "left", "degrees": 30})
+    assert [name for name, _ in module.dog.calls] == ["turn_left", "turn_left"]
+    assert ctx.get("current_heading") == 20.0
@@ -0,0 +1,23 @@
+import logging
+
+from houndmind_ai.core.runtime import RuntimeContext
+from houndmind_ai.navigation.obstacle_avoidance import ObstacleAvoidanceModule
+
+
+def test_tick_emits_one_coalesced_log_record(monkeypatch, caplog):
+    module = ObstacleAvoidanceModule("obstacle_avoidance")
+    monkeypatch.setattr(
+        module, "_scan_open_space", lambda ctx, s, n: ("forward", 80.0, True)
+    )
+    ctx = RuntimeContext()
+    ctx.set("settings", {"navigation": {}})
+
+    with caplog.at_level(
+        logging.INFO, logger="houndmind_ai.navigation.obstacle_avoidance"
+    ):
+        module.tick(ctx)
+
+    records = [r for r in caplog.records if r.getMessage().startswith("Navigation")]
+    assert len(records) == 1
+    assert "scan dir=forward score=80.0 confirmed=True" in records[0].getMessage()
+    assert module._tick_log == {}
@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+from houndmind_ai.core.runtime import RuntimeContext
+from houndmind_ai.navigation.orientation import OrientationModule
+
+
+class FakeSensorService:
+    def __init__(self):
+        self.readings = []
+
+    def history(self):
+        return list(self.readings)
+
+    def subscribe(self, callback):
+        raise AssertionError("batch mode should not subscribe to callbacks")
+
+
+def test_batch_updates_integrate_buffered_history():
+    service = FakeSensorService()
+    ctx = RuntimeContext()
+    ctx.set("settings", {"orientation": {"batch_updates": True, "calibration_enabled": False}})
+    ctx.set("sensor_service", service)
+    module = OrientationModule("orientation")
+    module.start(ctx)
+
+    service.readings = [
+        SimpleNamespace(gyro=(0.0, 0.0, 10.0), timestamp=ts) for ts in (0.0, 0.5, 1.0)
+    ]
+    module.tick(ctx)
+    assert abs(ctx.get("current_heading") - 10.0) < 1e-6
+
+    # Already-processed samples are skipped on the next drain.
+    service.readings.append(SimpleNamespace(gyro=(0.0, 0.0, 10.0), timestamp=2.0))
+    module.tick(ctx)
+    assert abs(ctx.get("current_heading") - 20.0) < 1e-6
@@ -43,3 +43,73 @@ def test_mapping_module_uses_hook():
     assert isinstance(plan, dict)
     assert plan.get("success") is True
     assert plan.get("path") and plan["path"][0] == (0, 0)
+
+
+def test_astar_returns_shortest_path_around_wall():
+    grid = [
+        [0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 0],
+        [0, 0, 0, 1, 0],
+        [1, 1, 0, 1, 0],
+        [0, 0, 0, 0, 0],
+    ]
+    path = astar(grid, (0, 0), (0, 4))
+    assert path[0] == (0, 0) and path[-1] == (0, 4)
+    assert len(path) == 9
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        assert abs(x1 - x2) + abs(y1 - y2) == 1
+        assert grid[y2][x2] == 0
+
+
+def test_astar_no_path():
+    grid = [
+        [0, 1, 0],
+        [1, 1, 0],
+        [0, 0, 0],
+    ]
+    assert astar(grid, (0, 0), (2, 2)) == []
+
+
+def test_default_hook_accepts_goal_from_json_list():
+    grid = [[0, 0], [0, 0]]
+    plan = default_path_planning_hook(
+        {"grid_map": grid, "current_cell": (0, 0)}, None, {"goal": [1, 1]}
+    )
+    assert plan["success"] is True
+    assert plan["path"][-1] == (1, 1)
+
+
+def test_astar_open_grid_does_not_flood():
+    n = 50
+    grid = [[0] * n for _ in range(n)]
+    calls = []
+
+    def passable(v):
+        calls.append(v)
+        return v == 0
+
+    path = astar(grid, (0, 0), (n - 1, n - 1), passable=passable)
+    assert len(path) == 2 * n - 1
+    # A corner-to-corner search should stay near the path, not visit all n*n cells.
+    assert len(calls) < 8 * n
+
+
+def test_astar_tests_each_blocked_cell_once():
+    # Walls carry distinct ids so repeated passable() checks are visible.
+    grid = [
+        [0, 0, 0, 0, 0],
+        [0, 1, 2, 3, 0],
+        [0, 4, 0, 5, 0],
+        [0, 6, 7, 8, 0],
+        [0, 0, 0, 0, 0],
+    ]
+    seen = []
+
+    def passable(v):
+        seen.append(v)
+        return v == 0
+
+    path = astar(grid, (0, 0), (4, 4), passable=passable)
+    assert len(path) == 9
+    walls = [v for v in seen if v]
+    assert len(walls) == len(set(walls))
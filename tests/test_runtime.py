@@ -1,8 +1,9 @@
+import time
 import unittest
 
 from houndmind_ai.core.config import Config, LoopConfig
 from houndmind_ai.core.module import Module, ModuleError
-from houndmind_ai.core.runtime import HoundMindRuntime
+from houndmind_ai.core.runtime import HoundMindRuntime, RuntimeContext
 
 
 class CounterModule(Module):
@@ -32,6 +33,16 @@ class RuntimeTests(unittest.TestCase):
         runtime.run()
         self.assertEqual(counter.count, 2)
 
+    def test_tick_publishes_module_heartbeat_and_duration(self) -> None:
+        config = Config(
+            loop=LoopConfig(tick_hz=1000, max_cycles=2), modules={}, settings={}
+        )
+        runtime = HoundMindRuntime(config, [CounterModule()])
+        runtime.run()
+        ctx = runtime.context
+        self.assertIsInstance(ctx.get("module_heartbeat:counter"), float)
+        self.assertIsInstance(ctx.get("module_tick_duration:counter"), float)
+
     def test_optional_module_failure_is_disabled(self) -> None:
         config = Config(
             loop=LoopConfig(tick_hz=1000, max_cycles=1), modules={}, settings={}
@@ -53,6 +64,66 @@ class RuntimeTests(unittest.TestCase):
         with self.assertRaises(ModuleError):
             runtime.run()
 
+    def test_stop_runs_in_reverse_order_once(self) -> None:
+        stopped: list[str] = []
+
+        class RecordingModule(Module):
+            def stop(self, context) -> None:
+                stopped.append(self.name)
+
+        config = Config(
+            loop=LoopConfig(tick_hz=1000, max_cycles=1), modules={}, settings={}
+        )
+        modules = [RecordingModule("sensors"), RecordingModule("voice")]
+        runtime = HoundMindRuntime(config, modules)
+        runtime.run()
+        runtime.stop()
+        self.assertEqual(stopped, ["voice", "sensors"])
+        self.assertFalse(any(m.status.started for m in modules))
+
+    def test_start_and_stop_log_one_record_each(self) -> None:
+        config = Config(
+            loop=LoopConfig(tick_hz=1000, max_cycles=1), modules={}, settings={}
+        )
+        runtime = HoundMindRuntime(config, [CounterModule("a"), CounterModule("b")])
+        with self.assertLogs("houndmind_ai.core.runtime", level="INFO") as logs:
+            runtime.start()
+            runtime.stop()
+        self.assertEqual(
+            logs.output,
+            [
+                "INFO:houndmind_ai.core.runtime:Started modules (2): a, b",
+                "INFO:houndmind_ai.core.runtime:Stopped modules (2): b, a",
+            ],
+        )
+
+    def test_stop_timeouts_share_one_deadline(self) -> None:
+        budgets: list[float] = []
+
+        class SlowModule(Module):
+            def stop(self, context) -> None:
+                budgets.append(self.stop_timeout(context, 2.0))
+                time.sleep(0.05)
+
+        config = Config(
+            loop=LoopConfig(tick_hz=1000, max_cycles=1),
+            modules={},
+            settings={"performance": {"shutdown_timeout_s": 0.5}},
+        )
+        modules = [SlowModule("a"), SlowModule("b")]
+        runtime = HoundMindRuntime(config, modules)
+        runtime.run()
+        self.assertLessEqual(budgets[0], 0.5)
+        self.assertLess(budgets[1], budgets[0])
+        self.assertEqual(modules[0].stop_timeout(runtime.context, 2.0), 2.0)
+
+    def test_stop_timeout_minimum_survives_expired_deadline(self) -> None:
+        module = Module("hw")
+        context = RuntimeContext()
+        context.set("shutdown_deadline", time.monotonic() - 1.0)
+        self.assertEqual(module.stop_timeout(context, 2.0), 0.0)
+        self.assertEqual(module.stop_timeout(context, 2.0, minimum=1.0), 1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
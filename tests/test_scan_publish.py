@@ -0,0 +1,86 @@
+from houndmind_ai.core.runtime import RuntimeContext
+from houndmind_ai.navigation.scanning import ScanningModule, ScanReading
+
+
+def test_publish_reading_keeps_bounded_serialized_history():
+    ctx = RuntimeContext()
+    module = ScanningModule("scanning")
+    module._context = ctx
+    module._history_dicts = type(module._history_dicts)(maxlen=2)
+
+    for i in range(3):
+        reading = ScanReading(
+            mode="three_way",
+            data={"left": 10.0 + i, "forward": 50.0, "right": 0.0},
+            timestamp=float(i),
+        )
+        module._publish_reading(reading)
+
+    history = ctx.get("scan_history")
+    assert [entry["timestamp"] for entry in history] == [1.0, 2.0]
+    assert history[-1] is ctx.get("scan_latest")
+    assert ctx.get("scan_quality")["valid_ratio"] == 2 / 3
+
+
+class _Ultrasonic:
+    def __init__(self):
+        self.reads = 0
+
+    def read_distance(self):
+        self.reads += 1
+        return 40.0
+
+
+class _HeadOnlyDog:
+    def __init__(self):
+        self.ultrasonic = _Ultrasonic()
+        self.yaws = []
+
+    def head_move(self, angles, speed=None):
+        self.yaws.append(angles[0][0])
+
+
+def test_three_way_scan_uses_ultrasonic_fallback_reader(monkeypatch):
+    from houndmind_ai.navigation import scanning
+
+    monkeypatch.setattr(scanning.time, "sleep", lambda s: None)
+    dog = _HeadOnlyDog()
+    service = scanning.ScanningService(
+        dog, {"scan_yaw_max_deg": 45, "scan_samples": 2, "scan_between_reads_s": 0}
+    )
+    reading = service.scan_three_way()
+    assert reading.data == {"forward": 40.0, "right": 40.0, "left": 40.0}
+    assert dog.ultrasonic.reads == 6
+    assert dog.yaws == [0, -45, 45, 0]
+
+
+def test_request_scan_wakes_background_loop(monkeypatch):
+    import threading
+
+    from houndmind_ai.navigation import scanning
+
+    monkeypatch.setattr(scanning.time, "sleep", lambda s: None)
+    service = scanning.ScanningService(
+        _HeadOnlyDog(),
+        {
+            "scan_mode": "three_way",
+            "scan_samples": 1,
+            "scan_interval_s": 60,
+            "scan_interval_max_s": 60,
+        },
+    )
+    first, second = threading.Event(), threading.Event()
+
+    def on_reading(reading):
+        (second if first.is_set() else first).set()
+
+    service.subscribe(on_reading)
+    service.start()
+    try:
+        assert first.wait(2.0)
+        service.request_scan()
+        # Without the wake-up the next scan would be a minute away.
+        assert second.wait(2.0)
+    finally:
+        service.stop(timeout=2.0)
+    assert not service._thread.is_alive()
@@ -63,3 +63,49 @@ def test_sensor_health_led_and_log(monkeypatch):
     module.tick(ctx)
     # Just check that no exceptions and context was updated
     assert True
+
+
+def test_sensor_service_stop_does_not_wait_out_poll_period():
+    import time
+
+    settings = {
+        "poll_hz": 1,
+        "enable_ultrasonic": False,
+        "enable_touch": False,
+        "enable_sound": False,
+        "enable_imu": False,
+    }
+    service = SensorService(dog=None, settings=settings)
+    service.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    service.stop(timeout=2.0)
+    assert time.monotonic() - started < 0.5
+    assert not service._thread.is_alive()
+
+
+def test_sensor_module_keeps_pidog_open_while_poll_thread_runs():
+    from houndmind_ai.core.runtime import RuntimeContext
+    from houndmind_ai.hal.sensors import SensorModule
+
+    class StuckService:
+        def stop(self, timeout=2.0):
+            return False
+
+    class FakeDog:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    ctx = RuntimeContext()
+    module = SensorModule("sensors")
+    module.dog = FakeDog()
+    module.service = StuckService()
+    ctx.set("pidog_owner", "sensors")
+    module.stop(ctx)
+    assert module.dog.closed is False
+
+    module.service = None
+    module.stop(ctx)
+    assert module.dog.closed is True
@@ -34,3 +34,47 @@ def test_rtabmap_fallback_to_stub_when_unavailable():
     # if RTAB-Map bindings are not present, module should report stub backend
     assert isinstance(status, dict)
     assert status.get("backend") in ("stub", "rtabmap")
+
+
+def test_rtabmap_map_data_fetched_at_refresh_interval():
+    class FakeAdapter:
+        def __init__(self):
+            self.map_calls = 0
+
+        def process(self, frame, imu=None, timestamp=None):
+            pass
+
+        def get_pose(self):
+            return [1.0, 2.0, 0.0, 0.0, 0.0, 0.5, 0.9]
+
+        def get_map_data(self):
+            self.map_calls += 1
+            return {"points": self.map_calls}
+
+        def get_trajectory(self):
+            return []
+
+    ctx = RuntimeContext()
+    settings = {"slam_pi4": {"interval_s": 0.0, "map_refresh_interval_s": 60.0}}
+    ctx.set("settings", settings)
+    m = SlamPi4Module("slam", enabled=True)
+    m.available = True
+    m._adapter = FakeAdapter()
+
+    m.tick(ctx)
+    m.tick(ctx)
+
+    assert m._adapter.map_calls == 1
+    assert ctx.get("slam_map_data") == {"points": 1}
+    assert ctx.get("slam_pose")["x"] == 1.0
+
+
+def test_normalize_angle_wraps_to_half_open_range():
+    norm = SlamPi4Module._normalize_angle
+    assert norm(0.0) == 0.0
+    assert norm(180.0) == 180.0
+    assert norm(-180.0) == 180.0
+    assert norm(190.0) == -170.0
+    assert norm(-190.0) == 170.0
+    assert norm(720.0 + 45.0) == 45.0
+    assert abs(norm(360.0 * 100000 + 30.0) - 30.0) < 1e-6
@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+from houndmind_ai.navigation.obstacle_avoidance import ObstacleAvoidanceModule
+from houndmind_ai.core.runtime import RuntimeContext
+
+
+def _tick_stuck(module, ctx, settings, now, acc):
+    ctx.set("sensor_reading", SimpleNamespace(acc=acc))
+    return module._check_stuck(ctx, settings, now)
+
+
+def test_stuck_detected_after_low_movement_window():
+    module = ObstacleAvoidanceModule("navigation")
+    ctx = RuntimeContext()
+    settings = {
+        "stuck_time_window_s": 5.0,
+        "stuck_movement_threshold": 100.0,
+        "stuck_min_samples": 3,
+        "stuck_cooldown_s": 0.0,
+    }
+    assert not _tick_stuck(module, ctx, settings, 0.0, (10, 10, 10))
+    assert not _tick_stuck(module, ctx, settings, 1.0, (10, 10, 10))
+    assert _tick_stuck(module, ctx, settings, 2.0, (10, 10, 10))
+
+
+def test_stuck_window_drops_old_samples():
+    module = ObstacleAvoidanceModule("navigation")
+    ctx = RuntimeContext()
+    settings = {
+        "stuck_time_window_s": 1.5,
+        "stuck_movement_threshold": 100.0,
+        "stuck_min_samples": 2,
+        "stuck_cooldown_s": 0.0,
+    }
+    # A burst of strong movement followed by stillness: once the burst ages
+    # out of the window the average falls below the threshold.
+    assert not _tick_stuck(module, ctx, settings, 0.0, (1000, 0, 0))
+    assert not _tick_stuck(module, ctx, settings, 1.0, (0, 0, 0))
+    assert _tick_stuck(module, ctx, settings, 2.0, (0, 0, 0))
+    assert abs(module._movement_sum) < 1e-9
@@ -1,3 +1,7 @@
+import json
+
+import pytest
+
 from houndmind_ai.optional.telemetry_dashboard import TelemetryDashboardModule
 
 
@@ -6,3 +10,70 @@ def test_get_snapshot_for_trace_matches():
     module._snapshot = {"timestamp": 1.0, "trace_id": "match-1", "data": {}}
     assert module.get_snapshot_for_trace("match-1") is module._snapshot
     assert module.get_snapshot_for_trace("different") is None
+
+
+def test_http_server_reuses_connection():
+    import http.client
+
+    module = TelemetryDashboardModule("telemetry_dashboard", enabled=True)
+    module._maybe_start_http({"http": {"enabled": True, "port": 0}})
+    host, port = module._http_server.server_address
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    try:
+        conn.request("GET", "/status")
+        first = conn.getresponse()
+        assert json.loads(first.read()) == {"status": "ok"}
+        assert not first.will_close
+        sock = conn.sock
+        assert sock is not None
+        conn.request("GET", "/snapshot")
+        second = conn.getresponse()
+        assert second.status == 200
+        second.read()
+        assert conn.sock is sock
+    finally:
+        conn.close()
+        module.stop(None)
+
+
+def test_http_server_rejects_open_connections_after_stop():
+    import http.client
+
+    module = TelemetryDashboardModule("telemetry_dashboard", enabled=True)
+    module._maybe_start_http({"http": {"enabled": True, "port": 0}})
+    host, port = module._http_server.server_address
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    try:
+        conn.request("GET", "/status")
+        first = conn.getresponse()
+        first.read()
+        assert first.status == 200
+        module.stop(None)
+        conn.request("GET", "/snapshot")
+        second = conn.getresponse()
+        second.read()
+        assert second.status == 503
+        assert second.will_close
+    finally:
+        conn.close()
+
+
+def test_encode_json_matches_stdlib_semantics(monkeypatch):
+    from houndmind_ai.optional import telemetry_dashboard as td
+
+    payload = {"a": 1.5, 2: "two", "obj": object, "big": 1 << 70}
+    encoded = json.loads(td._encode_json(payload))
+    monkeypatch.setattr(td, "orjson", None)
+    assert json.loads(td._encode_json(payload)) == encoded
+    assert encoded["2"] == "two"
+    assert encoded["big"] == 1 << 70
+
+
+def test_encode_json_keeps_numpy_scalars_numeric(monkeypatch):
+    np = pytest.importorskip("numpy")
+    from houndmind_ai.optional import telemetry_dashboard as td
+
+    payload = {"x": np.float64(1.5), "i": np.int64(3)}
+    assert json.loads(td._encode_json(payload)) == {"x": 1.5, "i": 3}
+    monkeypatch.setattr(td, "orjson", None)
+    assert json.loads(td._encode_json(payload)) == {"x": 1.5, "i": 3}
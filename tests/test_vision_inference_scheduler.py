@@ -23,3 +23,33 @@ def test_scheduler_basic():
     for i, res in enumerate(results):
         assert res['frame'] == f"frame_{i}"
         assert res['result'] == 'ok'
+
+def test_full_queue_keeps_newest_frames_and_counts_drops():
+    scheduler = VisionInferenceScheduler(dummy_inference, max_queue_size=2)
+    # Not started: frames stay queued.
+    for i in range(5):
+        scheduler.submit_frame(f"frame_{i}")
+    assert scheduler.pending() == 2
+    assert scheduler.dropped_frames == 3
+    assert [scheduler.frame_queue.get_nowait() for _ in range(2)] == ["frame_3", "frame_4"]
+
+def test_drop_not_counted_when_worker_drains_queue_first():
+    import queue
+
+    class RacingQueue(queue.Queue):
+        # put_nowait sees a full queue, then the worker empties it before eviction.
+        def __init__(self):
+            super().__init__(maxsize=1)
+            self.raced = False
+
+        def put_nowait(self, item):
+            if not self.raced:
+                self.raced = True
+                raise queue.Full
+            super().put_nowait(item)
+
+    scheduler = VisionInferenceScheduler(dummy_inference, max_queue_size=1)
+    scheduler.frame_queue = RacingQueue()
+    scheduler.submit_frame("frame_0")
+    assert scheduler.dropped_frames == 0
+    assert scheduler.frame_queue.get_nowait() == "frame_0"
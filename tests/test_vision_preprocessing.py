@@ -19,3 +19,11 @@ def test_roi():
     pre = VisionPreprocessor({"resize": (224, 224), "normalize": False, "roi": (100, 100, 200, 200)})
     out = pre.process(frame)
     assert out.shape == (224, 224, 3)
+
+def test_normalize_stays_float32():
+    frame = np.full((224, 224, 3), 200, dtype=np.uint8)
+    pre = VisionPreprocessor({"resize": (224, 224), "normalize": True})
+    out = pre.process(frame)
+    assert out.dtype == np.float32
+    expected = (200 / 255.0 - pre.mean) / pre.std
+    assert np.allclose(out[0, 0], expected, atol=1e-5)
@@ -0,0 +1,16 @@
+from houndmind_ai.optional.voice import VoiceModule
+
+
+def test_resolve_action_prefers_longest_key_in_text():
+    mod = VoiceModule("voice")
+    mapping = {"wag": "wag tail", "wag tail": "wag tail", "back": "backward", "sit": "sit"}
+    assert mod._resolve_action("please sit down", mapping, {}) == "sit"
+    assert mod._resolve_action("go back now", mapping, {}) == "backward"
+    assert mod._resolve_action("hello there", mapping, {}) is None
+
+
+def test_resolve_action_rebuilds_pattern_when_map_changes():
+    mod = VoiceModule("voice")
+    assert mod._resolve_action("stand up", {"sit": "sit"}, {}) is None
+    assert mod._resolve_action("stand up", {"stand": "stand"}, {}) == "stand"
+    assert mod._resolve_action("anything", {}, {}) is None